@@ -1,226 +1,44 @@
+import time
+STARTUP_BEGIN = time.perf_counter()     # 시작 시간 측정 기준 (import 포함)
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
-import json
+from tkinter import messagebox
 import os
+import bisect
+import multiprocessing
+from balancer import ROLES_KEY, WARN_DIFF, DANGER_DIFF, balance_top, rebalance
+from assignment import balance_by_roles_top
+from matchlog import MatchLog, COMPACT_EVERY, apply_result, journal_path, snapshot_mark_path
+from storage import BackgroundWriter
+from leaderboard import Leaderboard
+from namesearch import NameIndex
+from ratings import RatingBook
+from rolestats import RoleStats
+from lineupcache import LineupCache, cache_path
+from sqlite_store import SqliteStore, is_sqlite_path
+from core import Player, load_roster, merge_rosters, history_games, score_block
+from widgets import COLORS, LOCALE, VirtualList, ProfileOverlay, BackgroundJob
+from profiling import profiler, profiled, dump_path
 
 version = "v1.1.2"
-ctk.set_appearance_mode("Dark")
-ctk.set_default_color_theme("dark-blue")
-
-COLORS = {
-    "bg_main": "#36393F",       
-    "bg_sec": "#2F3136",        
-    "card": "#202225",          
-    "accent": "#5865F2",        
-    "danger": "#ED4245",        
-    "success": "#57F287",      
-    "edit": "#FAA61A",          
-    "text_main": "#FFFFFF",     
-    "text_dim": "#B9BBBE",      
-    "border_warn": "#FAA61A"    
-}
-
-# 로케일 데이터
-ROLES_KEY = ["TOP", "JUNGLE", "MID", "ADC", "SUPPORT"]
-LOCALE = {
-    "KR": {
-        "roles": ["탑", "정글", "미드", "원딜", "서폿"],
-        "role_opts": ["선택 안함", "탑", "정글", "미드", "원딜", "서폿"]
-    },
-    "EN": {
-        "roles": ["TOP", "JUNGLE", "MID", "ADC", "SUPPORT"],
-        "role_opts": ["None", "TOP", "JUNGLE", "MID", "ADC", "SUPPORT"]
-    }
-}
-
-class Player:
-    def __init__(self, name, scores, main_role="선택 안함", sub_role="선택 안함", wins=0, losses=0):
-        self.name = name
-        self.scores = scores
-        self.main_role = main_role
-        self.sub_role = sub_role
-        self.wins = wins
-        self.losses = losses
-
-    def to_dict(self):
-        return {
-            'name': self.name, 
-            'scores': self.scores,
-            'main_role': self.main_role,
-            'sub_role': self.sub_role,
-            'wins': self.wins,
-            'losses': self.losses
-        }
-
-    @staticmethod
-    def from_dict(data):
-        return Player(
-            data['name'], 
-            data['scores'], 
-            data.get('main_role', "선택 안함"), 
-            data.get('sub_role', "선택 안함"),
-            data.get('wins', 0),    # 하위 호환성 (기존 데이터 없을 시 0)
-            data.get('losses', 0)
-        )
-
-class HistoryWindow(ctk.CTkToplevel):
-    def __init__(self, parent, participants):
-        super().__init__(parent)
-        self.title("Match History")
-        self.geometry("600x600")
-        self.configure(fg_color=COLORS["bg_main"])
-        self.transient(parent)
-        self.grab_set()
-
-        ctk.CTkLabel(self, text="HALL OF FAME", font=("Roboto Medium", 20), text_color=COLORS["text_main"]).pack(pady=20)
-
-        # 헤더
-        header_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_sec"], height=40)
-        header_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Matches(총 경기 수) 컬럼
-        headers = ["Name", "Matches", "Wins", "Losses", "Win Rate"]
-        widths = [140, 70, 70, 70, 90]
-        
-        for i, h in enumerate(headers):
-            lbl = ctk.CTkLabel(header_frame, text=h, font=("Roboto", 12, "bold"), width=widths[i], text_color=COLORS["text_dim"])
-            lbl.pack(side="left", padx=5)
-
-        # 리스트 (총 경기 수 순 정렬)
-        scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        scroll.pack(fill="both", expand=True, padx=10, pady=5)
-
-        sorted_players = sorted(participants.values(), key=lambda p: (p.wins + p.losses, p.wins / (p.wins + p.losses) if (p.wins + p.losses) > 0 else 0), reverse=True)
-
-        for p in sorted_players:
-            row = ctk.CTkFrame(scroll, fg_color=COLORS["card"])
-            row.pack(fill="x", pady=2)
-            
-            total = p.wins + p.losses
-            rate = f"{(p.wins/total)*100:.1f}%" if total > 0 else "-"
-            
-            ctk.CTkLabel(row, text=p.name, width=140, anchor="w", text_color=COLORS["text_main"]).pack(side="left", padx=5)
-            ctk.CTkLabel(row, text=str(total), width=70, text_color=COLORS["text_main"]).pack(side="left", padx=5) # Matches 표시
-            ctk.CTkLabel(row, text=str(p.wins), width=70, text_color=COLORS["success"]).pack(side="left", padx=5)
-            ctk.CTkLabel(row, text=str(p.losses), width=70, text_color=COLORS["danger"]).pack(side="left", padx=5)
-            ctk.CTkLabel(row, text=rate, width=90, text_color=COLORS["accent"]).pack(side="left", padx=5)
-
-class PlayerDialog(ctk.CTkToplevel):
-    def __init__(self, parent, callback, current_lang="KR", player_to_edit=None, original_name=None):
-        super().__init__(parent)
-        self.callback = callback
-        self.current_lang = current_lang
-        self.player_to_edit = player_to_edit
-        self.original_name = original_name
-
-        self.role_names = LOCALE[self.current_lang]["roles"]
-        self.role_opts = LOCALE[self.current_lang]["role_opts"]
-
-        title_text = "Edit Player" if player_to_edit else "Add Player"
-        btn_text = "Save" if player_to_edit else "Register"
-        
-        self.title(title_text)
-        self.geometry("400x550")
-        self.configure(fg_color=COLORS["bg_main"])
-        self.resizable(False, False)
-        self.transient(parent)
-        self.grab_set()
-
-        ctk.CTkLabel(self, text=title_text, font=("Roboto Medium", 20), text_color=COLORS["text_main"]).pack(pady=(20, 10))
-
-        self.name_entry = ctk.CTkEntry(self, placeholder_text="Name", width=300, height=40, fg_color=COLORS["card"])
-        self.name_entry.pack(pady=10)
-        
-        if player_to_edit:
-            self.name_entry.insert(0, player_to_edit.name)
-
-        # 역할 선택
-        role_frame = ctk.CTkFrame(self, fg_color="transparent")
-        role_frame.pack(pady=5, padx=50, fill="x")
-
-        ctk.CTkLabel(role_frame, text="Main Role", font=("Roboto", 12), text_color=COLORS["text_dim"]).grid(row=0, column=0, padx=5, sticky="w")
-        self.main_role_combo = ctk.CTkComboBox(role_frame, values=self.role_opts, width=140, state="readonly")
-        self.main_role_combo.grid(row=1, column=0, padx=5, pady=(0, 10))
-        
-        ctk.CTkLabel(role_frame, text="Sub Role", font=("Roboto", 12), text_color=COLORS["text_dim"]).grid(row=0, column=1, padx=5, sticky="w")
-        self.sub_role_combo = ctk.CTkComboBox(role_frame, values=self.role_opts, width=140, state="readonly")
-        self.sub_role_combo.grid(row=1, column=1, padx=5, pady=(0, 10))
-
-        if player_to_edit:
-            # 기존 데이터가 로케일 옵션에 없을 수 있으므로(언어 변경 시), 값 체크 후 설정
-            m_role = player_to_edit.main_role if player_to_edit.main_role in self.role_opts else self.role_opts[0]
-            s_role = player_to_edit.sub_role if player_to_edit.sub_role in self.role_opts else self.role_opts[0]
-            self.main_role_combo.set(m_role)
-            self.sub_role_combo.set(s_role)
-        else:
-            self.main_role_combo.set(self.role_opts[0])
-            self.sub_role_combo.set(self.role_opts[0])
-
-        # 점수 슬라이더
-        score_container = ctk.CTkFrame(self, fg_color="transparent")
-        score_container.pack(pady=10, padx=20, fill="x")
-
-        self.score_vars = {}
-        self.score_labels = {}
-
-        for i, role_key in enumerate(ROLES_KEY):
-            row = ctk.CTkFrame(score_container, fg_color=COLORS["bg_sec"], corner_radius=8)
-            row.pack(fill="x", pady=5, ipady=5)
-
-            lbl = ctk.CTkLabel(row, text=self.role_names[i], width=60, font=("Roboto", 12, "bold"), text_color=COLORS["text_dim"])
-            lbl.pack(side="left", padx=10)
-
-            initial_val = 5
-            if player_to_edit:
-                initial_val = player_to_edit.scores.get(role_key, 5)
-
-            val_lbl = ctk.CTkLabel(row, text=str(initial_val), width=30, font=("Roboto", 14, "bold"), text_color=COLORS["accent"])
-            val_lbl.pack(side="right", padx=10)
-            self.score_labels[role_key] = val_lbl
-
-            var = ctk.IntVar(value=initial_val)
-            self.score_vars[role_key] = var
-            
-            slider = ctk.CTkSlider(row, from_=0, to=10, number_of_steps=10, variable=var,
-                                   command=lambda v, r=role_key: self.update_label(r, v),
-                                   progress_color=COLORS["accent"], button_color="white", button_hover_color=COLORS["accent"])
-            slider.pack(side="right", fill="x", expand=True, padx=10)
-
-        ctk.CTkButton(self, text=btn_text, command=self.save_player, width=300, height=45, fg_color=COLORS["success"], font=("Roboto", 14, "bold")).pack(pady=20, side="bottom")
-
-    def update_label(self, role, value):
-        self.score_labels[role].configure(text=str(int(value)))
-
-    def save_player(self):
-        name = self.name_entry.get().strip()
-        if not name:
-            messagebox.showwarning("Error", "Name required.")
-            return
-
-        scores = {role: self.score_vars[role].get() for role in ROLES_KEY}
-        
-        # 기존 승/패 정보 유지
-        wins = 0
-        losses = 0
-        if self.player_to_edit:
-            wins = self.player_to_edit.wins
-            losses = self.player_to_edit.losses
-
-        new_player = Player(name, scores, self.main_role_combo.get(), self.sub_role_combo.get(), wins, losses)
-        
-        if self.original_name:
-            self.callback(new_player, self.original_name)
-        else:
-            self.callback(new_player)
-        self.destroy()
+DEFAULT_DB_PATH = "participants.db"     # 이 파일이 있으면 participants.json 대신 사용
+SELECT_TIMING = bool(os.environ.get("BALANCER_SELECT_TIMING"))   # 자리 선택마다 처리 시간 출력
+STARTUP_TIMING = bool(os.environ.get("BALANCER_STARTUP_TIMING")) # 시작 단계별 시간 출력
+LOAD_POLL_MS = 30   # 백그라운드 불러오기 완료 확인 주기
 
 class LaneRow(ctk.CTkFrame):
-    def __init__(self, parent, role_idx, role_key, players_dict, update_callback):
+    def __init__(self, parent, role_idx, role_key, players_dict, update_callback, search_callback, redraw_callback):
         super().__init__(parent, fg_color=COLORS["card"], corner_radius=15, border_width=2, border_color=COLORS["bg_sec"])
         self.role_key = role_key
         self.role_idx = role_idx
         self.players_dict = players_dict
         self.update_callback = update_callback 
+        self.search_callback = search_callback  # (검색어, 이 자리의 현재 이름) -> 고를 수 있는 이름 목록
+        self.redraw_callback = redraw_callback  # 라벨/테두리 설정은 앱이 모아서 idle 때 한 번에 (redraw)
+        self.diff = None    # 레드 - 블루 점수차 (두 자리 모두 찼을 때만)
+        self.committed = ["", ""]   # 레드/블루 자리에 마지막으로 확정된 이름 (입력 중인 글자와 구분)
+        self.scores = [None, None]  # 레드/블루 점수 (빈 자리는 None), 재배치 시 재사용
+        self.shown = [None, None, None]     # 위젯에 마지막으로 설정한 (레드 점수, 블루 점수, 테두리 색)
+        self.options = [None, None] # 콤보박스에 마지막으로 설정한 목록
         self.pack(fill='x', pady=8, padx=10)
 
         self.columnconfigure(0, weight=1) 
@@ -230,10 +48,10 @@ class LaneRow(ctk.CTkFrame):
         self.columnconfigure(4, weight=1) 
 
         self.red_var = ctk.StringVar()
-        self.red_combo = ctk.CTkComboBox(self, variable=self.red_var, state="readonly", 
+        self.red_combo = ctk.CTkComboBox(self, variable=self.red_var, 
                                          fg_color=COLORS["bg_sec"], border_color=COLORS["bg_sec"], button_color=COLORS["danger"],
                                          text_color=COLORS["text_main"], dropdown_fg_color=COLORS["bg_sec"],
-                                         command=self.on_select)
+                                         command=lambda choice: self.on_select(0))
         self.red_combo.grid(row=0, column=0, padx=15, pady=15, sticky="ew")
 
         self.red_score_lbl = ctk.CTkLabel(self, text="-", font=("Roboto", 18, "bold"), text_color=COLORS["danger"], width=40)
@@ -249,11 +67,16 @@ class LaneRow(ctk.CTkFrame):
         self.blue_score_lbl.grid(row=0, column=3, padx=5)
 
         self.blue_var = ctk.StringVar()
-        self.blue_combo = ctk.CTkComboBox(self, variable=self.blue_var, state="readonly",
+        self.blue_combo = ctk.CTkComboBox(self, variable=self.blue_var,
                                           fg_color=COLORS["bg_sec"], border_color=COLORS["bg_sec"], button_color=COLORS["accent"],
                                           text_color=COLORS["text_main"], dropdown_fg_color=COLORS["bg_sec"],
-                                          command=self.on_select)
+                                          command=lambda choice: self.on_select(1))
         self.blue_combo.grid(row=0, column=4, padx=15, pady=15, sticky="ew")
+
+        # 이름을 입력하면 드롭다운 목록을 검색 결과로 좁힘 (Enter: 첫 번째 결과 선택)
+        for side, combo in enumerate((self.red_combo, self.blue_combo)):
+            combo.bind("<KeyRelease>", lambda e, s=side: self.on_type(s, e))
+            combo.bind("<FocusOut>", lambda e, s=side: self.on_focus_out(s))
         
         self.update_role_text("KR") # 초기값
 
@@ -261,80 +84,203 @@ class LaneRow(ctk.CTkFrame):
         text = LOCALE[lang_code]["roles"][self.role_idx]
         self.role_lbl.configure(text=text)
 
-    def on_select(self, choice):
+    def on_select(self, side):
         self.update_ui()
-        self.update_callback()
+        self.update_callback(self.role_idx + side * len(ROLES_KEY))
 
-    def update_dropdown_options(self, all_players_list, global_selected_set):
-        current_red = self.red_var.get()
-        red_options = [""] + [name for name in all_players_list if name not in global_selected_set or name == current_red]
-        self.red_combo.configure(values=red_options)
+    def side_widgets(self, side):
+        return (self.red_var, self.red_combo) if side == 0 else (self.blue_var, self.blue_combo)
 
-        current_blue = self.blue_var.get()
-        blue_options = [""] + [name for name in all_players_list if name not in global_selected_set or name == current_blue]
-        self.blue_combo.configure(values=blue_options)
+    def on_type(self, side, event):
+        var, combo = self.side_widgets(side)
+        if event.keysym in ("Return", "KP_Enter"):
+            self.commit_typed(side)
+            return
+        self.options[side] = [""] + self.search_callback(var.get(), self.committed[side])
+        combo.configure(values=self.options[side])
+
+    def commit_typed(self, side):
+        var, combo = self.side_widgets(side)
+        text = var.get().strip()
+        if text:
+            matches = self.search_callback(text, self.committed[side])
+            if text not in matches:
+                text = matches[0] if matches else self.committed[side]
+        var.set(text)
+        if text != self.committed[side]:
+            self.on_select(side)
+        else:
+            self.update_dropdown_options()
+
+    def on_focus_out(self, side):
+        # 벗어날 때 입력한 글자를 자리에 확정: 비웠거나 고를 수 있는 이름이면 반영, 아니면 원래 이름으로 되돌림
+        var, combo = self.side_widgets(side)
+        text = var.get().strip()
+        if text == self.committed[side]:
+            return
+        if text and text not in self.search_callback(text, self.committed[side]):
+            var.set(self.committed[side])
+            self.update_dropdown_options()
+            return
+        var.set(text)
+        self.on_select(side)
+
+    def update_dropdown_options(self):
+        # 목록이 실제로 바뀐 콤보박스만 다시 설정
+        for side in (0, 1):
+            var, combo = self.side_widgets(side)
+            options = [""] + self.search_callback("", var.get())
+            if options != self.options[side]:
+                self.options[side] = options
+                combo.configure(values=options)
 
     def update_ui(self):
-        r_name = self.red_var.get()
-        b_name = self.blue_var.get()
-        
-        r_score = self.players_dict[r_name].scores[self.role_key] if r_name and r_name in self.players_dict else 0
-        b_score = self.players_dict[b_name].scores[self.role_key] if b_name and b_name in self.players_dict else 0
-
-        self.red_score_lbl.configure(text=str(r_score) if r_name and r_name in self.players_dict else "-")
-        self.blue_score_lbl.configure(text=str(b_score) if b_name and b_name in self.players_dict else "-")
-
-        if r_name and b_name and r_name in self.players_dict and b_name in self.players_dict:
-            diff = abs(r_score - b_score)
-            if diff >= 4:
-                self.configure(border_color=COLORS["danger"])
-            elif diff >= 2:
-                self.configure(border_color=COLORS["border_warn"])
-            else:
-                self.configure(border_color=COLORS["bg_sec"])
-        else:
-            self.configure(border_color=COLORS["bg_sec"])
+        # 점수/점수차만 바로 계산하고 위젯은 redraw 에서 (여러 라인을 바꿔도 한 번만 그림)
+        # 목록에 없는 글자(입력 중이거나 삭제된 선수)는 빈 자리로
+        self.committed = [name if name in self.players_dict else "" for name in (self.red_var.get(), self.blue_var.get())]
+        data = score_block.data
+        self.scores = [data[self.players_dict[name].offset + self.role_idx] if name else None for name in self.committed]
+        r_score, b_score = self.scores
+        self.diff = r_score - b_score if r_score is not None and b_score is not None else None
+        self.redraw_callback(self)
+
+    def border_color(self):
+        diff = abs(self.diff) if self.diff is not None else 0
+        if diff >= DANGER_DIFF:
+            return COLORS["danger"]
+        if diff >= WARN_DIFF:
+            return COLORS["border_warn"]
+        return COLORS["bg_sec"]
+
+    def redraw(self):
+        # 바뀐 위젯만 다시 설정
+        shown = ["-" if score is None else str(score) for score in self.scores] + [self.border_color()]
+        if shown[0] != self.shown[0]:
+            self.red_score_lbl.configure(text=shown[0])
+        if shown[1] != self.shown[1]:
+            self.blue_score_lbl.configure(text=shown[1])
+        if shown[2] != self.shown[2]:
+            self.configure(border_color=shown[2])
+        self.shown = shown
 
 class PlayerCard(ctk.CTkFrame):
-    def __init__(self, parent, player, edit_command, delete_command):
+    # VirtualPlayerList 가 재사용하는 카드, set_player 로 보여줄 선수만 바꿈
+    def __init__(self, parent, edit_command, delete_command):
         super().__init__(parent, fg_color=COLORS["card"], corner_radius=6)
-        self.pack(fill="x", pady=1) 
-        
-        display_text = player.name
-        roles = []
-        if player.main_role not in ["선택 안함", "None"]: roles.append(player.main_role)
-        if player.sub_role not in ["선택 안함", "None"]: roles.append(player.sub_role)
-        if roles: display_text += f" ({', '.join(roles)})"
+        self.name = None
+        self.display_text = None
 
-        self.name_lbl = ctk.CTkLabel(self, text=display_text, font=("Roboto", 13), text_color=COLORS["text_main"], anchor="w")
+        self.name_lbl = ctk.CTkLabel(self, text="", font=("Roboto", 13), text_color=COLORS["text_main"], anchor="w")
         self.name_lbl.pack(side="left", padx=10, pady=5)
         
         self.del_btn = ctk.CTkButton(self, text="×", width=24, height=24, 
                                      fg_color="transparent", hover_color=COLORS["danger"], text_color=COLORS["text_dim"],
                                      font=("Roboto", 14, "bold"),
-                                     command=lambda: delete_command(player.name))
+                                     command=lambda: delete_command(self.name))
         self.del_btn.pack(side="right", padx=(2, 5))
 
         self.edit_btn = ctk.CTkButton(self, text="✎", width=24, height=24,
                                       fg_color="transparent", hover_color=COLORS["edit"], text_color=COLORS["text_dim"],
                                       font=("Roboto", 14, "bold"),
-                                      command=lambda: edit_command(player.name))
+                                      command=lambda: edit_command(self.name))
         self.edit_btn.pack(side="right", padx=(0, 2))
 
+    def set_player(self, player):
+        display_text = player.name
+        roles = []
+        if player.main_role not in ["선택 안함", "None"]: roles.append(player.main_role)
+        if player.sub_role not in ["선택 안함", "None"]: roles.append(player.sub_role)
+        if roles: display_text += f" ({', '.join(roles)})"
+
+        self.name = player.name
+        if display_text != self.display_text:
+            self.display_text = display_text
+            self.name_lbl.configure(text=display_text)
+
+class VirtualPlayerList(VirtualList):
+    # 참가자 사이드바: 정렬된 이름 목록을 PlayerCard 로 보여줌
+    def __init__(self, parent, participants, edit_command, delete_command):
+        super().__init__(parent)
+        self.participants = participants
+        self.edit_command = edit_command
+        self.delete_command = delete_command
+        self.names = []     # 정렬된 이름 목록
+
+    def row_count(self):
+        return len(self.names)
+
+    def make_row(self):
+        return PlayerCard(self.viewport, self.edit_command, self.delete_command)
+
+    def bind_row(self, row, index):
+        row.set_player(self.participants[self.names[index]])
+
+    def set_names(self, names):
+        self.names = sorted(names)
+        self.render()
+
+    def insert(self, name):
+        bisect.insort(self.names, name)
+        self.render()
+
+    def remove(self, name):
+        i = bisect.bisect_left(self.names, name)
+        if i < len(self.names) and self.names[i] == name:
+            del self.names[i]
+        self.render()
+
+    def replace(self, old_name, new_name):
+        if old_name != new_name:
+            i = bisect.bisect_left(self.names, old_name)
+            if i < len(self.names) and self.names[i] == old_name:
+                del self.names[i]
+            bisect.insort(self.names, new_name)
+        self.render()
+
 class TeamBuilderApp(ctk.CTk):
     def __init__(self):
+        self.startup = {'imports': time.perf_counter() - STARTUP_BEGIN}
         super().__init__()
         self.title("5v5 Ballancer")
         self.geometry("1100x650")
         self.configure(fg_color=COLORS["bg_main"])
 
         self.participants = {} 
+        self.leaderboard = Leaderboard(self.participants)   # History 창 정렬 캐시
+        self.name_index = NameIndex()   # 라인 콤보박스 이름 검색
+        self.selected_set = set()       # 라인에 배치된 이름
+        # 자리별 이름/점수와 팀 합계 (자리 하나가 바뀌면 그 차이만 반영), 자리 번호는 rebalance 와 같음
+        self.slot_names = [""] * (2 * len(ROLES_KEY))
+        self.slot_scores = [0] * (2 * len(ROLES_KEY))
+        self.totals = [0, 0]
+        self.record_ready = None
+        # 위젯 설정은 모아뒀다가 after_idle 한 번에 (자리 10개를 채워도 그리기는 한 번)
+        self.dirty_lanes = set()
+        self.views_dirty = False
+        self.redraw_job = None
         self.lanes = []
         self.current_lang = "KR"
         self.current_file_path = "participants.json"
+        self.store = None   # SQLite 사용 시 SqliteStore
+        if os.path.exists(DEFAULT_DB_PATH):
+            self.current_file_path = DEFAULT_DB_PATH
+            self.store = SqliteStore(DEFAULT_DB_PATH)
+        self.match_log = MatchLog(self.current_file_path)
+        self.writer = BackgroundWriter()
+        self.ratings = RatingBook()     # 경기 기록에서 계산한 레이팅
+        self.role_stats = RoleStats()   # 경기 기록에서 모은 라인별 / 상대별 전적
+        self.lineup_cache = LineupCache(self.current_file_path)    # 같은 10명의 밸런스 결과
+
+        self.balance_job = None     # 스레드에서 도는 Auto Balance / Suggestions 탐색
 
         self.setup_ui()
+        if profiler.enabled:
+            self.setup_profiling()
+        self.mark_startup('ui')
+        # 창을 먼저 띄우고 참가자 목록은 백그라운드에서 읽어서 채움
+        self.after_idle(lambda: self.mark_startup('window'))
         self.load_data()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def setup_ui(self):
         self.grid_columnconfigure(1, weight=1)
@@ -345,26 +291,37 @@ class TeamBuilderApp(ctk.CTk):
         sidebar.grid(row=0, column=0, sticky="nsew")
         sidebar.grid_propagate(False)
 
-        ctk.CTkLabel(sidebar, text="PARTICIPANTS", font=("Roboto", 16, "bold"), text_color=COLORS["text_dim"]).pack(pady=(20, 10))
+        self.list_title = ctk.CTkLabel(sidebar, text="PARTICIPANTS", font=("Roboto", 16, "bold"), text_color=COLORS["text_dim"])
+        self.list_title.pack(pady=(20, 10))
 
-        self.scroll_list = ctk.CTkScrollableFrame(sidebar, fg_color="transparent")
-        self.scroll_list.pack(fill="both", expand=True, padx=5, pady=5)
+        self.player_list = VirtualPlayerList(sidebar, self.participants, self.open_edit_dialog, self.delete_player)
+        self.player_list.pack(fill="both", expand=True, padx=5, pady=5)
 
-        btn_add = ctk.CTkButton(sidebar, text="+  Add Player", command=self.open_add_dialog,
+        self.btn_add = ctk.CTkButton(sidebar, text="+  Add Player", command=self.open_add_dialog,
                                 height=40, corner_radius=8, fg_color=COLORS["accent"], hover_color="#4752C4",
                                 font=("Roboto", 13, "bold"))
-        btn_add.pack(fill="x", padx=15, pady=(20, 10))
+        self.btn_add.pack(fill="x", padx=15, pady=(20, 10))
+
+        self.btn_load = ctk.CTkButton(sidebar, text="📂  Load Data", command=self.load_external_data,
+                                height=40, corner_radius=8, fg_color=COLORS["card"], hover_color=COLORS["bg_main"],
+                                font=("Roboto", 13, "bold"), text_color=COLORS["text_dim"])
+        self.btn_load.pack(fill="x", padx=15, pady=(0, 10))
 
-        btn_load = ctk.CTkButton(sidebar, text="📂  Load Data", command=self.load_external_data,
+        self.btn_sqlite = ctk.CTkButton(sidebar, text="🗄  Convert to SQLite", command=self.convert_to_sqlite,
                                 height=40, corner_radius=8, fg_color=COLORS["card"], hover_color=COLORS["bg_main"],
                                 font=("Roboto", 13, "bold"), text_color=COLORS["text_dim"])
-        btn_load.pack(fill="x", padx=15, pady=(0, 10))
+        self.btn_sqlite.pack(fill="x", padx=15, pady=(0, 10))
 
         btn_history = ctk.CTkButton(sidebar, text="📜  History", command=self.open_history,
                                 height=40, corner_radius=8, fg_color=COLORS["card"], hover_color=COLORS["bg_main"],
                                 font=("Roboto", 13, "bold"), text_color=COLORS["text_dim"])
         btn_history.pack(fill="x", padx=15, pady=(0, 10))
 
+        btn_lobby = ctk.CTkButton(sidebar, text="👥  Lobby", command=self.open_lobby,
+                                height=40, corner_radius=8, fg_color=COLORS["card"], hover_color=COLORS["bg_main"],
+                                font=("Roboto", 13, "bold"), text_color=COLORS["text_dim"])
+        btn_lobby.pack(fill="x", padx=15, pady=(0, 10))
+
         # 언어선택
         self.btn_lang = ctk.CTkButton(sidebar, text="Language: KR", command=self.toggle_language,
                                 height=40, corner_radius=8, fg_color=COLORS["card"], hover_color=COLORS["bg_main"],
@@ -398,15 +355,57 @@ class TeamBuilderApp(ctk.CTk):
         self.lanes_container.pack(fill="both", expand=True)
 
         for i, role in enumerate(ROLES_KEY):
-            lane = LaneRow(self.lanes_container, i, role, self.participants, self.refresh_combos)
+            lane = LaneRow(self.lanes_container, i, role, self.participants, self.on_lane_select, self.search_names,
+                           self.request_redraw)
             self.lanes.append(lane)
 
+        # 자동 밸런스 버튼 (배치된 10명을 다시 나눔)
+        balance_frame = ctk.CTkFrame(main_area, fg_color="transparent")
+        balance_frame.pack(fill="x", padx=50, pady=(10, 0))
+
+        self.btn_balance = ctk.CTkButton(balance_frame, text="⚖  Auto Balance", command=self.auto_balance,
+                                         height=40, corner_radius=10, fg_color=COLORS["accent"], hover_color="#4752C4",
+                                         font=("Roboto", 14, "bold"))
+        self.btn_balance.pack(side="left", fill="x", expand=True, padx=(0, 5))
+
+        self.btn_suggest = ctk.CTkButton(balance_frame, text="☰  Suggestions", command=self.open_suggestions,
+                                         height=40, corner_radius=10, fg_color=COLORS["card"], hover_color=COLORS["bg_sec"],
+                                         font=("Roboto", 14, "bold"), text_color=COLORS["text_dim"])
+        self.btn_suggest.pack(side="left", fill="x", expand=True, padx=(5, 0))
+
+        # 선호 라인 반영 모드 (팀 분배만 탐색하고 라인은 main/sub role 기준으로 배정)
+        self.role_pref_var = ctk.BooleanVar(value=False)
+        ctk.CTkSwitch(balance_frame, text="Role Preference", variable=self.role_pref_var,
+                      progress_color=COLORS["accent"], font=("Roboto", 12), text_color=COLORS["text_dim"]).pack(side="left", padx=(15, 0))
+
+        # 자리 하나를 바꾸면 현재 배치를 유지한 채 교환 몇 번으로 다시 맞춤
+        self.auto_rebalance_var = ctk.BooleanVar(value=False)
+        ctk.CTkSwitch(balance_frame, text="Auto Rebalance", variable=self.auto_rebalance_var,
+                      progress_color=COLORS["accent"], font=("Roboto", 12), text_color=COLORS["text_dim"]).pack(side="left", padx=(15, 0))
+
+        # 경기 기록으로 계산한 레이팅(Elo)을 숙련도 점수에 더해서 밸런스
+        self.use_ratings_var = ctk.BooleanVar(value=False)
+        ctk.CTkSwitch(balance_frame, text="Use Ratings", variable=self.use_ratings_var,
+                      progress_color=COLORS["accent"], font=("Roboto", 12), text_color=COLORS["text_dim"]).pack(side="left", padx=(15, 0))
+
+        # 라인별 승률(경기 수가 적으면 50% 쪽으로 보정)로 숙련도 점수를 조정해서 밸런스
+        self.use_lane_stats_var = ctk.BooleanVar(value=False)
+        ctk.CTkSwitch(balance_frame, text="Lane Win Rates", variable=self.use_lane_stats_var,
+                      progress_color=COLORS["accent"], font=("Roboto", 12), text_color=COLORS["text_dim"]).pack(side="left", padx=(15, 0))
+
         # 결과 기록 버튼 (조건부 활성화)
         self.btn_record = ctk.CTkButton(main_area, text="Record Game Result", command=self.record_match,
                                         height=50, corner_radius=10, fg_color=COLORS["success"], 
                                         font=("Roboto", 16, "bold"), state="disabled")
         self.btn_record.pack(fill="x", padx=50, pady=20)
 
+    def setup_profiling(self):
+        # BALANCER_PROFILE 사용 시에만: 오버레이(Ctrl+Shift+P), 다음 동작 cProfile 기록(Ctrl+Shift+R)
+        profiler.idle_hook = self.after_idle
+        self.profile_overlay = ProfileOverlay(self, profiler)
+        self.bind("<Control-P>", lambda e: self.profile_overlay.toggle())
+        self.bind("<Control-R>", lambda e: profiler.arm())
+
     def toggle_language(self):
         if self.current_lang == "KR":
             self.current_lang = "EN"
@@ -419,51 +418,173 @@ class TeamBuilderApp(ctk.CTk):
         for lane in self.lanes:
             lane.update_role_text(self.current_lang)
 
+    # 창/파일 대화상자 모듈은 처음 열 때 import (시작 시간 단축)
     def open_add_dialog(self):
+        from windows import PlayerDialog
         PlayerDialog(self, self.add_player_callback, self.current_lang)
 
     def open_edit_dialog(self, name):
+        from windows import PlayerDialog
         if name in self.participants:
             player = self.participants[name]
             PlayerDialog(self, self.edit_player_callback, self.current_lang, player_to_edit=player, original_name=name)
 
+    @profiled("HistoryWindow")
     def open_history(self):
-        HistoryWindow(self, self.participants)
+        from windows import HistoryWindow
+        HistoryWindow(self, self.leaderboard, self.role_stats)
+
+    def open_lobby(self):
+        from windows import LobbyWindow
+        LobbyWindow(self, self.participants, self.apply_lineup)
     
     def load_external_data(self):
-        file_path = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        from tkinter import filedialog
+        paths = filedialog.askopenfilenames(
+            filetypes=[("JSON files", "*.json"), ("SQLite DB", "*.db *.sqlite *.sqlite3"), ("All files", "*.*")]
+        )
+        if not paths:
+            return
+        if self.match_log.pending:
+            self.save_data()
+
+        if len(paths) == 1:
+            file_path = paths[0]
+            self.start_load(lambda errors, progress: self.read_roster(file_path, None, errors, progress),
+                            lambda result, errors, elapsed: self.finish_external_load(file_path, result, errors))
+            return
+
+        # 여러 파일을 고르면 하나로 합쳐서 새 파일로 저장 (이름이 같으면 승/패 합산)
+        if any(is_sqlite_path(p) for p in paths):
+            messagebox.showerror("Error", "Only JSON files can be merged.")
+            return
+        out_path = filedialog.asksaveasfilename(
+            defaultextension=".json", initialfile="merged.json", filetypes=[("JSON files", "*.json")]
+        )
+        if not out_path:
+            return
+        if os.path.abspath(out_path) in {os.path.abspath(p) for p in paths}:
+            messagebox.showerror("Error", "Save the merged roster to a new file.")
+            return
+        # 저장 창은 .json 덮어쓰기만 물어보므로, 옆에 있는 경기 기록/캐시도 바뀐다는 것을 따로 확인
+        companions = [p for p in (journal_path(out_path), cache_path(out_path)) if os.path.exists(p)]
+        if companions and not messagebox.askyesno(
+                "Merge", "These files will be replaced by the merged roster:\n"
+                + "\n".join(os.path.basename(p) for p in companions)
+                + "\n\nContinue?"):
+            return
+        self.start_load(lambda errors, progress: self.merge_files(paths, out_path, errors, progress),
+                        lambda result, errors, elapsed: self.finish_external_load(out_path, result, errors, len(paths)))
+
+    @profiled("load_external")
+    def finish_external_load(self, file_path, result, errors, merged=0):
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"Failed to load file: {result}")
+            return
+
+        # LaneRow 등이 같은 dict 를 참조하므로 내용만 교체
+        participants, store, match_log, ratings, role_stats, lineup_cache = result
+        self.participants.clear()
+        self.participants.update(participants)
+        self.match_log = match_log
+        self.switch_store(store)
+        self.ratings = ratings
+        self.role_stats = role_stats
+        self.lineup_cache = lineup_cache
+
+        self.current_file_path = file_path
+        self.title(f"5v5 Ballancer - {os.path.basename(file_path)}")
+
+        self.update_list_ui()
+        self.refresh_combos()
+        if merged:
+            self.save_data()
+            message = f"Merged {merged} files ({len(participants)} players) into: {os.path.basename(file_path)}"
+        else:
+            message = f"Loaded and switched to: {os.path.basename(file_path)}"
+        if errors:
+            messagebox.showwarning("Loaded with errors", message + "\n\n" + self.error_summary(errors))
+        else:
+            messagebox.showinfo("Success", message)
+
+    @staticmethod
+    def error_summary(errors, limit=10):
+        lines = errors[:limit]
+        if len(errors) > limit:
+            lines.append(f"... and {len(errors) - limit} more")
+        return (f"Skipped {len(errors)} invalid entries (they are not kept when the roster is saved):\n"
+                + "\n".join(lines))
+
+    def convert_to_sqlite(self):
+        if self.store:
+            messagebox.showinfo("SQLite", f"Already using {os.path.basename(self.current_file_path)}")
+            return
+
+        from tkinter import filedialog
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".db", initialfile=DEFAULT_DB_PATH,
+            filetypes=[("SQLite DB", "*.db *.sqlite *.sqlite3")]
         )
         if not file_path:
             return
-        
+
+        # 현재 JSON 을 최신 상태로 저장한 뒤 경기 기록과 함께 옮김
+        self.save_data()
+        self.writer.flush()
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                new_participants = {}
-                for name, p_data in data.items():
-                    new_participants[name] = Player.from_dict(p_data)
-                
-                self.participants = new_participants
-                
-                self.current_file_path = file_path
-                self.title(f"5v5 Ballancer - {os.path.basename(file_path)}")
-
-                self.update_list_ui()
-                self.refresh_combos()
-                messagebox.showinfo("Success", f"Loaded and switched to: {os.path.basename(file_path)}")
-                
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(file_path + suffix):
+                    os.remove(file_path + suffix)
+            store = SqliteStore(file_path)
+            errors = []
+            count = store.import_json(self.current_file_path, errors)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load file: {e}")
+            messagebox.showerror("Error", f"Failed to convert: {e}")
+            return
+
+        self.switch_store(store)
+        self.match_log = MatchLog(file_path)
+        self.lineup_cache.path = cache_path(file_path)
+        self.current_file_path = file_path
+        self.title(f"5v5 Ballancer - {os.path.basename(file_path)}")
+        message = f"Imported {count} players into {os.path.basename(file_path)}"
+        if errors:
+            messagebox.showwarning("Imported with errors", message + "\n\n" + self.error_summary(errors))
+        else:
+            messagebox.showinfo("Success", message)
+
+    def switch_store(self, store):
+        if self.store:
+            self.store.close()
+        self.store = store
+
+    def persist_player(self, player, original_name=None):
+        if self.store:
+            self.store.upsert_player(player, original_name)
+        else:
+            if original_name and original_name != player.name:
+                try:
+                    self.match_log.append_rename(original_name, player.name)
+                except Exception as e:
+                    print(f"Match log failed: {e}")
+            self.save_data()
+
+    def persist_delete(self, name):
+        if self.store:
+            self.store.delete_player(name)
+        else:
+            self.save_data()
 
     def add_player_callback(self, player):
         if player.name in self.participants:
             messagebox.showerror("Error", "Name exists.")
             return
         self.participants[player.name] = player
-        self.update_list_ui()
+        self.player_list.insert(player.name)
+        self.name_index.add(player.name)
+        self.leaderboard.update([player.name])
         self.refresh_combos()
-        self.save_data()
+        self.persist_player(player)
 
     def edit_player_callback(self, new_player, original_name):
         if new_player.name != original_name and new_player.name in self.participants:
@@ -474,66 +595,221 @@ class TeamBuilderApp(ctk.CTk):
             del self.participants[original_name]
         
         self.participants[new_player.name] = new_player
-        self.update_list_ui()
+        self.player_list.replace(original_name, new_player.name)
+        self.name_index.remove(original_name)
+        self.name_index.add(new_player.name)
+        self.leaderboard.update([original_name, new_player.name])
+        self.ratings.rename(original_name, new_player.name)
+        self.role_stats.rename(original_name, new_player.name)
+        self.invalidate_lineups(original_name, new_player.name)
         self.refresh_combos()
-        self.save_data()
+        self.persist_player(new_player, original_name)
 
     def delete_player(self, name):
         if messagebox.askyesno("Delete", f"Remove '{name}'?"):
             del self.participants[name]
-            self.update_list_ui()
+            self.player_list.remove(name)
+            self.name_index.remove(name)
+            self.leaderboard.update([name])
+            self.invalidate_lineups(name)
             self.refresh_combos()
-            self.save_data()
+            self.persist_delete(name)
 
+    @profiled("update_list_ui")
     def update_list_ui(self):
-        for widget in self.scroll_list.winfo_children():
-            widget.destroy()
-        for name in sorted(self.participants.keys()):
-            player = self.participants[name]
-            PlayerCard(self.scroll_list, player, self.open_edit_dialog, self.delete_player)
+        self.player_list.set_names(self.participants.keys())
+        self.name_index.set_names(self.participants.keys())
+        self.leaderboard.invalidate()
 
+    @profiled("refresh_combos")
     def refresh_combos(self, event=None):
-        selected_set = set()
-        
-        red_players = []
-        blue_players = []
-
+        # 전체 다시 계산 (선수 목록/점수가 바뀌었거나 여러 자리를 한꺼번에 바꿨을 때)
         for lane in self.lanes:
-            r = lane.red_var.get()
-            b = lane.blue_var.get()
-            if r: 
-                selected_set.add(r)
-                red_players.append(r)
-            if b: 
-                selected_set.add(b)
-                blue_players.append(b)
-            
-        all_players_list = sorted(list(self.participants.keys()))
-
+            lane.update_ui()
+        for slot in range(len(self.slot_names)):
+            self.set_slot(slot)
+        self.request_redraw()
+
+    @profiled("refresh_slot")
+    def refresh_slot(self, slot):
+        # 자리 하나만 바뀌었을 때: 그 자리의 이름/점수만 반영하고 나머지는 캐시 사용
+        self.set_slot(slot)
+        self.request_redraw()
+
+    def set_slot(self, slot):
+        # slot: 0~4 레드 라인, 5~9 블루 라인
+        n_lanes = len(ROLES_KEY)
+        lane = self.lanes[slot % n_lanes]
+        name = lane.committed[slot // n_lanes]
+        if not name or name not in self.participants:
+            name = ""
+        score = score_block.data[self.participants[name].offset + lane.role_idx] if name else 0
+
+        old = self.slot_names[slot]
+        if old and old not in self.slot_names[:slot] + self.slot_names[slot + 1:]:
+            self.selected_set.discard(old)
+        if name:
+            self.selected_set.add(name)
+        self.slot_names[slot] = name
+        self.totals[slot // n_lanes] += score - self.slot_scores[slot]
+        self.slot_scores[slot] = score
+
+    def request_redraw(self, lane=None):
+        # lane 이 없으면 콤보 목록/합계/기록 버튼, 실제 설정은 다음 idle 때 한 번에
+        if lane is None:
+            self.views_dirty = True
+        else:
+            self.dirty_lanes.add(lane)
+        if self.redraw_job is None:
+            self.redraw_job = self.after_idle(self.redraw)
+
+    @profiled("redraw")
+    def redraw(self):
+        self.redraw_job = None
+        lanes, self.dirty_lanes = self.dirty_lanes, set()
+        for lane in lanes:
+            lane.redraw()
+        if self.views_dirty:
+            self.views_dirty = False
+            self.refresh_views()
+
+    def refresh_views(self):
+        # 옵션/라벨/버튼은 내용이 바뀐 경우에만 다시 설정
         for lane in self.lanes:
-            lane.update_dropdown_options(all_players_list, selected_set)
+            lane.update_dropdown_options()
 
-        red_total = 0
-        blue_total = 0
-        
-        for lane in self.lanes:
-            r_name = lane.red_var.get()
-            b_name = lane.blue_var.get()
-            
-            if r_name and r_name in self.participants:
-                red_total += self.participants[r_name].scores[lane.role_key]
-            
-            if b_name and b_name in self.participants:
-                blue_total += self.participants[b_name].scores[lane.role_key]
-                
-        self.red_total_lbl.configure(text=f"Power: {red_total}")
-        self.blue_total_lbl.configure(text=f"Power: {blue_total}")
+        for lbl, total in ((self.red_total_lbl, self.totals[0]), (self.blue_total_lbl, self.totals[1])):
+            text = f"Power: {total}"
+            if lbl.cget("text") != text:
+                lbl.configure(text=text)
 
         # 기록 버튼 활성화 체크
-        if len(red_players) == 5 and len(blue_players) == 5:
-            self.btn_record.configure(state="normal", text="Record Game Result")
+        ready = all(self.slot_names)
+        if ready != self.record_ready:
+            self.record_ready = ready
+            if ready:
+                self.btn_record.configure(state="normal", text="Record Game Result")
+            else:
+                self.btn_record.configure(state="disabled", text="Fill all 10 slots to record")
+
+    def search_names(self, query, current=""):
+        # 다른 자리에 이미 배치된 이름은 빼고 검색
+        return self.name_index.search(query, self.selected_set - {current})
+
+    def balance_players(self, names):
+        # Use Ratings / Lane Win Rates 가 켜져 있으면 경기 기록으로 보정한 점수로 탐색 (둘 다 켜면 차례로)
+        players = self.participants
+        if self.use_ratings_var.get():
+            players = self.ratings.rated_players(players, names)
+        if self.use_lane_stats_var.get():
+            players = self.role_stats.weighted_players(players, names)
+        return players
+
+    @profiled("balance")
+    def find_lineups(self, names, k, on_result):
+        # 같은 10명 + 같은 점수/라인이면 저장된 결과를 바로, 아니면 스레드에서 탐색한 뒤 on_result(lineups)
+        players = self.balance_players(names)
+        mode = "roles" if self.role_pref_var.get() else "scores"
+        lineups = self.lineup_cache.get(players, names, mode, k)
+        if lineups is not None:
+            on_result(lineups)
+            return
+
+        # 탐색 중에 선수가 수정돼도 섞이지 않도록 10명만 따로 넘김
+        players = {name: players[name] for name in names}
+        search = balance_by_roles_top if mode == "roles" else balance_top
+
+        def done(result, elapsed):
+            self.set_balancing(None)
+            profiler.record("balance thread", elapsed)
+            if isinstance(result, Exception):
+                messagebox.showerror("Balance", f"Balancing failed: {result}")
+                return
+            self.lineup_cache.put(players, names, mode, k, result)
+            self.save_lineup_cache()
+            # 그 사이 자리가 바뀌었으면 결과는 캐시에만 남김
+            if sorted(self.selected_names()) == sorted(names):
+                on_result(result)
+
+        self.set_balancing(BackgroundJob(self, lambda report, cancel: search(players, names, k),
+                                         on_done=done, name="balancer"))
+
+    def set_balancing(self, job):
+        # 탐색 중에는 Auto Balance 버튼이 취소 버튼
+        self.balance_job = job
+        self.btn_balance.configure(text="✕  Cancel" if job else "⚖  Auto Balance")
+        self.btn_suggest.configure(state="disabled" if job else "normal")
+        self.configure(cursor="watch" if job else "")
+
+    def cancel_balance(self):
+        # 탐색은 끝까지 돌지만 결과는 버림
+        if self.balance_job:
+            self.balance_job.stop()
+            self.set_balancing(None)
+
+    def invalidate_lineups(self, *names):
+        if sum(self.lineup_cache.invalidate(name) for name in names):
+            self.save_lineup_cache()
+
+    def save_lineup_cache(self):
+        self.writer.request(self.lineup_cache.path, self.lineup_cache.to_json())
+
+    def selected_names(self):
+        # 입력 중인 글자가 아니라 확정된 자리 기준
+        return [n for n in self.slot_names if n]
+
+    @profiled("auto_balance")
+    def auto_balance(self):
+        if self.balance_job:
+            self.cancel_balance()
+            return
+        names = self.selected_names()
+        if len(names) != 10:
+            messagebox.showwarning("Auto Balance", "Fill all 10 slots to auto balance.")
+            return
+
+        self.find_lineups(names, 1, lambda lineups: self.apply_lineup(lineups[0]))
+
+    @profiled("suggestions")
+    def open_suggestions(self):
+        if self.balance_job:
+            return
+        names = self.selected_names()
+        if len(names) != 10:
+            messagebox.showwarning("Suggestions", "Fill all 10 slots to see suggestions.")
+            return
+
+        self.find_lineups(names, 10, self.show_suggestions)
+
+    def show_suggestions(self, lineups):
+        from windows import SuggestionWindow
+        SuggestionWindow(self, lineups, self.apply_lineup)
+
+    @profiled("select")
+    def on_lane_select(self, slot):
+        start = time.perf_counter()
+        self.refresh_slot(slot)
+        if SELECT_TIMING:
+            print(f"select slot {slot}: {(time.perf_counter() - start) * 1000:.2f} ms")
+        if not self.auto_rebalance_var.get() or len(self.selected_names()) != 10:
+            return
+
+        red = self.slot_names[:len(ROLES_KEY)]
+        blue = self.slot_names[len(ROLES_KEY):]
+        if self.use_ratings_var.get() or self.use_lane_stats_var.get():
+            # 캐시된 라인 점수는 입력 숙련도 기준이므로 보정 점수를 쓸 때는 다시 계산
+            lineup = rebalance(self.balance_players(red + blue), red, blue, changed=slot)
         else:
-            self.btn_record.configure(state="disabled", text="Fill all 10 slots to record")
+            lineup = rebalance(self.participants, red, blue, changed=slot, lane_scores=[lane.scores for lane in self.lanes])
+        if lineup.red != red or lineup.blue != blue:
+            self.apply_lineup(lineup)
+
+    @profiled("apply_lineup")
+    def apply_lineup(self, lineup):
+        for lane, r_name, b_name in zip(self.lanes, lineup.red, lineup.blue):
+            lane.red_var.set(r_name)
+            lane.blue_var.set(b_name)
+        self.refresh_combos()
 
     def record_match(self): #전적기록 팝업
         result_dialog = ctk.CTkToplevel(self)
@@ -548,45 +824,154 @@ class TeamBuilderApp(ctk.CTk):
         btn_frame.pack(fill="x", padx=20)
         
         def commit_result(winner):
-            # 점수 반영
-            for lane in self.lanes:
-                r_name = lane.red_var.get()
-                b_name = lane.blue_var.get()
-                
-                if winner == "RED":
-                    self.participants[r_name].wins += 1
-                    self.participants[b_name].losses += 1
-                else:
-                    self.participants[r_name].losses += 1
-                    self.participants[b_name].wins += 1
-            
-            self.save_data()
+            # 점수 반영 (경기 기록은 한 줄 추가, 전체 저장은 COMPACT_EVERY 경기마다)
+            red = self.slot_names[:len(ROLES_KEY)]
+            blue = self.slot_names[len(ROLES_KEY):]
+            if not all(red + blue):
+                result_dialog.destroy()
+                return
+            red_power = sum(self.participants[n].score(l) for l, n in enumerate(red))
+            blue_power = sum(self.participants[n].score(l) for l, n in enumerate(blue))
+            apply_result(self.participants, red, blue, winner)
+            self.leaderboard.update(red + blue)
+            self.ratings.record(red, blue, winner, red_power, blue_power)
+            self.role_stats.record(red, blue, winner)
+
+            if self.store:
+                self.store.record_game(red, blue, winner, red_power, blue_power)
+            else:
+                try:
+                    self.match_log.append_game(red, blue, winner, red_power, blue_power)
+                except Exception as e:
+                    print(f"Match log failed: {e}")
+                    self.save_data()
+                if self.match_log.pending >= COMPACT_EVERY:
+                    self.save_data()
             messagebox.showinfo("Success", f"{winner} Team Victory recorded!")
             result_dialog.destroy()
             
         ctk.CTkButton(btn_frame, text="RED WIN", fg_color=COLORS["danger"], command=lambda: commit_result("RED")).pack(side="left", padx=10, expand=True)
         ctk.CTkButton(btn_frame, text="BLUE WIN", fg_color=COLORS["accent"], command=lambda: commit_result("BLUE")).pack(side="right", padx=10, expand=True)
 
+    @profiled("save_data")
     def save_data(self):
+        if self.store:
+            self.store.save_players(self.participants.values())
+            return
+
+        # 스냅샷만 만들어 넘기고 실제 쓰기는 백그라운드에서 (연속 요청은 한 번으로 합쳐짐)
         data = {name: p.to_dict() for name, p in self.participants.items()}
+        match_log = self.match_log
+        games = match_log.total_games
+        self.writer.request(self.current_file_path, data, lambda: match_log.mark_compacted(games),
+                            lambda tmp_path: match_log.mark_snapshot(tmp_path, games))
+
+    def on_close(self):
+        # 스냅샷에 반영 안 된 경기가 있으면 종료 전에 저장
+        if self.match_log.pending:
+            self.save_data()
+        if dump_path():
+            profiler.dump(dump_path())
+        self.cancel_balance()
+        self.writer.close()
+        self.switch_store(None)
+        if self.redraw_job:
+            self.after_cancel(self.redraw_job)
+        self.destroy()
+
+    def load_data(self):
+        # 파일 읽기 + 경기 기록 재생 + 레이팅 계산은 스레드에서, 결과 반영은 UI 스레드에서
+        path, store = self.current_file_path, self.store
+        self.start_load(lambda errors, progress: self.read_roster(path, store, errors, progress),
+                        self.finish_startup_load)
+
+    def start_load(self, job, on_done):
+        # job(errors, progress) 는 스레드에서 실행, on_done(result 또는 예외, errors, 걸린 시간) 은 UI 스레드에서
+        self.set_loading(True)
+        errors = []
+
+        def done(result, elapsed):
+            self.set_loading(False)
+            on_done(result, errors, elapsed)
+
+        BackgroundJob(self, lambda report, cancel: job(errors, report),
+                      on_progress=lambda fraction: self.list_title.configure(text=f"LOADING... {fraction:.0%}"),
+                      on_done=done, poll_ms=LOAD_POLL_MS, name="roster-loader")
+
+    @staticmethod
+    def read_roster(path, store, errors, progress):
+        # 불러오기 스레드에서 실행, 반환값: (선수 dict, SqliteStore 또는 None, MatchLog, RatingBook, RoleStats, LineupCache)
+        if store:
+            participants = store.load_players(Player.from_dict)
+            match_log = MatchLog(path)
+        else:
+            participants, store, match_log = load_roster(path, errors, progress)
+
+        ratings = RatingBook()
+        role_stats = RoleStats()
         try:
-            with open(self.current_file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            games = history_games(store, match_log)
+            ratings.replay(games)
+            role_stats.replay(games)
         except Exception as e:
-            print(f"Save failed: {e}")
+            print(f"Rating replay failed: {e}")
+            ratings.clear()
+            role_stats.clear()
+        lineup_cache = LineupCache(path)
+        lineup_cache.load()
+        return participants, store, match_log, ratings, role_stats, lineup_cache
 
-    def load_data(self):
-        if os.path.exists(self.current_file_path):
-            try:
-                with open(self.current_file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for name, p_data in data.items():
-                        self.participants[name] = Player.from_dict(p_data)
-                self.update_list_ui()
-                self.refresh_combos()
-            except Exception as e:
-                print(f"Load failed: {e}")
+    @staticmethod
+    def merge_files(paths, out_path, errors, progress):
+        # 합친 경기 기록은 새 파일 옆으로 옮기고, 승/패는 이미 합산됐으므로 스냅샷 반영으로 표시
+        participants, games = merge_rosters(paths, errors, progress)
+        # 이전 파일의 캐시 / 스냅샷 표시가 새 명단에 섞이지 않도록
+        for stale in (cache_path(out_path), snapshot_mark_path(out_path)):
+            if os.path.exists(stale):
+                os.remove(stale)
+        match_log = MatchLog(out_path)
+        match_log.import_games(games)
+        ratings = RatingBook()
+        ratings.replay(games)
+        role_stats = RoleStats()
+        role_stats.replay(games)
+        return participants, None, match_log, ratings, role_stats, LineupCache(out_path)
+
+    @profiled("load_data")
+    def finish_startup_load(self, result, errors, elapsed):
+        if isinstance(result, Exception):
+            print(f"Load failed: {result}")
+            return
+        participants, self.store, self.match_log, self.ratings, self.role_stats, self.lineup_cache = result
+        self.participants.update(participants)
+        self.update_list_ui()
+        self.refresh_combos()
+        self.startup['parse'] = elapsed
+        profiler.record("load_data thread", elapsed)
+        self.mark_startup('roster')
+        if errors:
+            for error in errors:
+                print(f"Load: {error}")
+            messagebox.showwarning("Loaded with errors", self.error_summary(errors))
+
+    def set_loading(self, loading):
+        # 불러오는 동안 목록을 바꾸는 버튼은 막아둠
+        state = "disabled" if loading else "normal"
+        for btn in (self.btn_add, self.btn_load, self.btn_sqlite):
+            btn.configure(state=state)
+        self.list_title.configure(text="LOADING..." if loading else "PARTICIPANTS")
+
+    def mark_startup(self, stage):
+        self.startup[stage] = time.perf_counter() - STARTUP_BEGIN
+        if STARTUP_TIMING and 'window' in self.startup and 'roster' in self.startup:
+            s = self.startup
+            print(f"startup: imports {s['imports'] * 1000:.0f} ms, ui {s['ui'] * 1000:.0f} ms, "
+                  f"window {s['window'] * 1000:.0f} ms, roster {s['roster'] * 1000:.0f} ms "
+                  f"({len(self.participants)} players, parse {s['parse'] * 1000:.0f} ms)")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()    # PyInstaller --onefile 에서 ProcessPoolExecutor 사용
+    ctk.set_appearance_mode("Dark")
+    ctk.set_default_color_theme("dark-blue")
     app = TeamBuilderApp()
     app.mainloop()
\ No newline at end of file
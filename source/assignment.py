@@ -0,0 +1,127 @@
+import itertools
+
+from balancer import ROLES_KEY, MAX_SCORE, Lineup
+
+# Player.main_role / sub_role 은 한국어 이름, 예전 파일이나 다른 선수 객체는 영어 이름일 수 있음 (예: "탑", "TOP")
+ROLE_LABELS = [
+    ["탑", "정글", "미드", "원딜", "서폿"],
+    ROLES_KEY
+]
+
+# 라인 배치 비용에 더해지는 선호 라인 벗어남 패널티 (점수 단위)
+SUB_ROLE_PENALTY = 1
+OFF_ROLE_PENALTY = 3
+
+def role_index(label):
+    for labels in ROLE_LABELS:
+        if label in labels:
+            return labels.index(label)
+    return None
+
+def role_penalties(player):
+    main = role_index(player.main_role)
+    sub = role_index(player.sub_role)
+    if main is None and sub is None:
+        return [0] * len(ROLES_KEY)
+
+    penalties = [OFF_ROLE_PENALTY] * len(ROLES_KEY)
+    if sub is not None:
+        penalties[sub] = SUB_ROLE_PENALTY
+    if main is not None:
+        penalties[main] = 0
+    return penalties
+
+def hungarian(cost):
+    # n x n 비용 행렬의 최소 비용 배정 (O(n^3)), 반환값: 행 i 에 배정된 열 번호
+    n = len(cost)
+    inf = float("inf")
+    u = [0] * (n + 1)
+    v = [0] * (n + 1)
+    match = [0] * (n + 1)   # match[j]: 열 j 에 배정된 행 (1부터)
+    way = [0] * (n + 1)
+
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        min_v = [inf] * (n + 1)
+        used = [False] * (n + 1)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            delta = inf
+            j1 = 0
+            row = cost[i0 - 1]
+            for j in range(1, n + 1):
+                if not used[j]:
+                    cur = row[j - 1] - u[i0] - v[j]
+                    if cur < min_v[j]:
+                        min_v[j] = cur
+                        way[j] = j0
+                    if min_v[j] < delta:
+                        delta = min_v[j]
+                        j1 = j
+            for j in range(n + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_v[j] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    result = [0] * n
+    for j in range(1, n + 1):
+        result[match[j] - 1] = j - 1
+    return result
+
+def assign_roles(players, team):
+    # 5명 팀의 라인 배치: 점수가 높고 선호 라인에 가까울수록 비용이 낮다
+    cost = []
+    for name in team:
+        player = players[name]
+        penalties = role_penalties(player)
+        cost.append([MAX_SCORE - player.score(l) + penalties[l] for l in range(len(ROLES_KEY))])
+
+    lanes = hungarian(cost)
+    ordered = [None] * len(ROLES_KEY)
+    for name, l in zip(team, lanes):
+        ordered[l] = name
+    penalty = sum(role_penalties(players[name])[l] for name, l in zip(team, lanes))
+    return ordered, penalty
+
+def balance_by_roles_top(players, names, k=10):
+    # 팀 분배(126가지)만 탐색하고 각 팀의 라인은 선호 라인을 반영해 헝가리안 알고리즘으로 정한다
+    names = list(names)
+    if len(names) != 10 or len(set(names)) != 10:
+        raise ValueError("Exactly 10 distinct players required.")
+
+    assigned = {}
+
+    def team_lanes(team):
+        if team not in assigned:
+            assigned[team] = assign_roles(players, team)
+        return assigned[team]
+
+    first, others = names[0], names[1:]
+    results = []
+    for picked in itertools.combinations(others, 4):
+        red_team = (first,) + picked
+        blue_team = tuple(n for n in others if n not in picked)
+        red, red_penalty = team_lanes(red_team)
+        blue, blue_penalty = team_lanes(blue_team)
+
+        red_vec = [players[n].score(l) for l, n in enumerate(red)]
+        blue_vec = [players[n].score(l) for l, n in enumerate(blue)]
+        lineup = Lineup.from_vectors(red, blue, red_vec, blue_vec)
+        results.append((lineup.cost, red_penalty + blue_penalty, lineup))
+
+    results.sort(key=lambda r: (r[0], r[1]))
+    return [lineup for _, _, lineup in results[:k]]
+
+def balance_by_roles(players, names):
+    return balance_by_roles_top(players, names, 1)[0]
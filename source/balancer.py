@@ -0,0 +1,303 @@
+import heapq
+import itertools
+
+ROLES_KEY = ["TOP", "JUNGLE", "MID", "ADC", "SUPPORT"]
+
+# LaneRow 테두리 기준 (주의: 2~3점, 위험: 4점 이상)
+WARN_DIFF = 2
+DANGER_DIFF = 4
+
+# 비용 = 위험 라인 수 x DANGER_WEIGHT + 주의 라인 수 x WARN_WEIGHT + Power 차이 x GAP_WEIGHT + 라인 점수차 합
+#      + 자리마다 (MAX_SCORE - 점수) x SKILL_WEIGHT  (모두를 못하는 라인에 세워서 0 대 0 으로 맞추지 않도록)
+# 위험 라인은 숙련도와 상관없이 항상 먼저 피함 (숙련도 비용은 많아야 100 x SKILL_WEIGHT)
+# 나머지는 서로 맞바꿈: 10명 점수 합 1점 = Power 차이 2점, 점수 합 50점 = 주의 라인 하나
+#   (예: 39 : 39 보다 41 : 40 을, 0 대 0 라인만 있는 14 : 14 보다 주의 라인 하나 있는 45 : 45 를 고름)
+DANGER_WEIGHT = 1000000
+WARN_WEIGHT = 10000
+GAP_WEIGHT = 100
+SKILL_WEIGHT = 200
+MAX_SCORE = 10
+
+def lane_penalty(diff):
+    if diff >= DANGER_DIFF:
+        return diff + DANGER_WEIGHT
+    if diff >= WARN_DIFF:
+        return diff + WARN_WEIGHT
+    return diff
+
+PENALTY = [lane_penalty(d) for d in range(MAX_SCORE + 1)]
+
+def skill_penalty(total, slots):
+    # 자리 slots 개의 점수 합이 total 일 때의 숙련도 비용
+    return SKILL_WEIGHT * (slots * MAX_SCORE - total)
+
+def pair_cost(r, b):
+    # 한 라인(두 자리)의 비용, Power 차이 제외
+    return PENALTY[abs(r - b)] + skill_penalty(r + b, 2)
+
+def lane_status(diff):
+    # LaneRow 테두리 색과 같은 구분
+    if diff >= DANGER_DIFF:
+        return "danger"
+    if diff >= WARN_DIFF:
+        return "warn"
+    return "ok"
+
+class Lineup:
+    def __init__(self, red, blue, red_total, blue_total, cost, diffs):
+        self.red = red      # 라인 순서(ROLES_KEY)대로 이름
+        self.blue = blue
+        self.red_total = red_total
+        self.blue_total = blue_total
+        self.cost = cost
+        self.diffs = diffs  # 라인별 레드 - 블루 점수차
+
+    @property
+    def gap(self):
+        return abs(self.red_total - self.blue_total)
+
+    @property
+    def danger(self):
+        return sum(1 for d in self.diffs if abs(d) >= DANGER_DIFF)
+
+    @property
+    def warn(self):
+        return sum(1 for d in self.diffs if WARN_DIFF <= abs(d) < DANGER_DIFF)
+
+    def to_dict(self):
+        return {
+            'red': self.red,
+            'blue': self.blue,
+            'red_total': self.red_total,
+            'blue_total': self.blue_total,
+            'cost': self.cost,
+            'diffs': self.diffs
+        }
+
+    @staticmethod
+    def from_vectors(red, blue, red_vec, blue_vec):
+        # red_vec / blue_vec: 라인 순서대로 각 자리 선수의 그 라인 점수
+        return Lineup(red, blue, sum(red_vec), sum(blue_vec), lineup_cost(red_vec, blue_vec),
+                      [r - b for r, b in zip(red_vec, blue_vec)])
+
+def score_vector(player):
+    # core.Player 는 점수 배열에서 바로 읽고, 일반 dict 점수는 ROLES_KEY 순서로 읽음
+    vector = getattr(player, "vector", None)
+    if vector is not None:
+        return vector()
+    return tuple(player.scores[role] for role in ROLES_KEY)
+
+def score_vectors(players, names):
+    return [score_vector(players[name]) for name in names]
+
+def lineup_cost(red_vec, blue_vec):
+    cost = 0
+    gap = 0
+    for r, b in zip(red_vec, blue_vec):
+        cost += pair_cost(r, b)
+        gap += r - b
+    return cost + GAP_WEIGHT * abs(gap)
+
+def balance(players, names):
+    return balance_top(players, names, 1)[0]
+
+def balance_top(players, names, k=10):
+    # 10명을 레드/블루 + 라인에 배치하는 모든 경우 중 비용이 낮은 k개 배치를 찾음
+    names = list(names)
+    if len(names) != 10 or len(set(names)) != 10:
+        raise ValueError("Exactly 10 distinct players required.")
+
+    vecs = score_vectors(players, names)
+    lineups = []
+    for cost, red_idx, blue_idx in search_vectors(vecs, k):
+        lineup = Lineup.from_vectors([names[p] for p in red_idx], [names[q] for q in blue_idx],
+                                     [vecs[p][l] for l, p in enumerate(red_idx)],
+                                     [vecs[q][l] for l, q in enumerate(blue_idx)])
+        lineups.append(lineup)
+    return lineups
+
+def search_vectors(vecs, k=1):
+    # vecs: 10명의 라인별 점수 튜플, 반환값: 비용 순 (비용, 레드 번호, 블루 번호) k개
+    if k < 1:
+        raise ValueError("k must be at least 1.")
+    n_lanes = len(ROLES_KEY)
+    all_lanes = (1 << n_lanes) - 1
+    all_players = (1 << 10) - 1
+
+    # 선수 p가 라인 l에서 다른 누군가와 맞붙을 때 피할 수 없는 최소 라인 비용
+    pair_pen = [[[pair_cost(vecs[p][l], vecs[q][l]) for q in range(10)] for l in range(n_lanes)] for p in range(10)]
+    player_floor = [[min(pair_pen[p][l][q] for q in range(10) if q != p) for l in range(n_lanes)] for p in range(10)]
+    lane_floor = [min(player_floor[p][l] for p in range(10)) for l in range(n_lanes)]
+    # 남은 라인 조합(free)별로 미리: 선수 p의 최소 라인 비용 / 가장 높은 점수
+    lane_sets = [[l for l in range(n_lanes) if free >> l & 1] for free in range(all_lanes + 1)]
+    free_floor = [[min((player_floor[p][l] for l in ls), default=0) for ls in lane_sets] for p in range(10)]
+    free_best = [[max((vecs[p][l] for l in ls), default=0) for ls in lane_sets] for p in range(10)]
+
+    # 평균에서 멀리 떨어진 선수를 먼저 배치해야 Power 차이 하한이 빨리 좁혀진다
+    means = [sum(v[l] for v in vecs) / 10 for l in range(n_lanes)]
+    spread = [sum(abs(v[l] - means[l]) for l in range(n_lanes)) for v in vecs]
+
+    # 점수 벡터가 같은 선수는 상대로 고를 때 번호가 가장 작은 한 명만 시도
+    twins = [0] * 10
+    for p in range(10):
+        for q in range(p):
+            if vecs[q] == vecs[p]:
+                twins[p] |= 1 << q
+
+    # 남은 선수를 두 명씩 짝지을 때의 최소 비용 (라인 중복은 무시한 하한)
+    match_memo = {}
+
+    def matching(free, mask):
+        if not mask:
+            return 0
+        key = free << 10 | mask
+        if key in match_memo:
+            return match_memo[key]
+        p = (mask & -mask).bit_length() - 1
+        rest = mask & ~(1 << p)
+        lanes = lane_sets[free]
+        value = float("inf")
+        for q in range(p + 1, 10):
+            if rest >> q & 1:
+                edge = min(pair_pen[p][l][q] for l in lanes)
+                if edge < value:
+                    value = min(value, edge + matching(free, rest & ~(1 << q)))
+        match_memo[key] = value
+        return value
+
+    # 지금까지 찾은 상위 k개 (비용이 큰 것이 맨 앞에 오도록 음수로 저장)
+    found = []
+    order = itertools.count()
+    seen = {}
+    red = [0] * n_lanes
+    blue = [0] * n_lanes
+
+    def limit():
+        return -found[0][0] if len(found) >= k else float("inf")
+
+    def search(free, used, cost, gap):
+        # 반환값: 이 상태에서 남은 배치 비용의 하한
+        if not free:
+            rest = GAP_WEIGHT * abs(gap)
+            total = cost + rest
+            if total < limit():
+                entry = (-total, next(order), red[:], blue[:])
+                if len(found) >= k:
+                    heapq.heapreplace(found, entry)
+                else:
+                    heapq.heappush(found, entry)
+            return rest
+
+        lanes = lane_sets[free]
+        unused = [p for p in range(10) if not used >> p & 1]
+
+        # 하한: 남은 라인 비용, 가장 배치하기 어려운 선수의 최소 비용, Power 차이
+        floor = sum(lane_floor[l] for l in lanes)
+        pick = -1
+        pick_key = (-1, -1)
+        for p in unused:
+            f = free_floor[p][free]
+            if (f, spread[p]) > pick_key:
+                pick, pick_key = p, (f, spread[p])
+        pick_floor = pick_key[0]
+        floor = max(floor, pick_floor, matching(free, all_players & ~used))
+        slack = 0
+        for l in lanes:
+            col = [vecs[p][l] for p in unused]
+            slack += max(col) - min(col)
+        # 숙련도 비용의 하한 (남은 선수가 각자 남은 라인 중 가장 잘하는 곳에 선다고 볼 때)
+        skill = skill_penalty(sum(free_best[p][free] for p in unused), len(unused))
+        # 라인 비용 >= 숙련도 비용 + 점수차 이므로 Power 차이를 줄이려면 그만큼 라인 비용이 든다
+        excess = abs(gap) - slack
+        if excess > 0:
+            bound = max(floor, skill + slack) + GAP_WEIGHT * excess
+        else:
+            bound = max(floor, skill + abs(gap))
+        # 같은 상태(남은 라인, 남은 선수, Power 차이)는 이전에 구한 하한을 재사용
+        key = (free << 10 | used, gap)
+        bound = max(bound, seen.get(key, 0))
+        if cost + bound >= limit():
+            return bound
+
+        # 가장 어려운 선수부터 라인/상대/진영을 정한다
+        # 레드/블루를 뒤집어도 같은 결과이므로 첫 배치는 레드로 고정
+        sides = (1,) if used == 0 else (1, -1)
+        children = []
+        for l in lanes:
+            row = pair_pen[pick][l]
+            for q in unused:
+                if q == pick or twins[q] & ~(used | (1 << pick)):
+                    continue
+                d = vecs[pick][l] - vecs[q][l]
+                for side in sides:
+                    children.append((row[q], l, q, side * d, side))
+        children.sort()
+
+        lower = float("inf")
+        for pen, l, q, d, side in children:
+            if cost + pen >= limit():
+                break
+            if side > 0:
+                red[l], blue[l] = pick, q
+            else:
+                red[l], blue[l] = q, pick
+            rest = search(free & ~(1 << l), used | (1 << pick) | (1 << q), cost + pen, gap + d)
+            lower = min(lower, pen + rest)
+        # 건너뛴 배치는 모두 현재 k번째 비용 이상
+        lower = max(bound, min(lower, limit() - cost))
+        seen[key] = lower
+        return lower
+
+    search(all_lanes, 0, 0, 0)
+
+    return [(-neg_total, red_idx, blue_idx) for neg_total, _, red_idx, blue_idx in sorted(found, reverse=True)]
+
+def rebalance(players, red, blue, changed=None, lane_scores=None):
+    # 현재 배치에서 시작해 슬롯 두 개를 맞바꾸는 이동만으로 개선한다
+    # 슬롯 번호: 0~4 레드 라인, 5~9 블루 라인 / changed: 방금 바뀐 슬롯 (그 슬롯의 교환을 먼저 시도)
+    # lane_scores: LaneRow.update_ui 가 계산해 둔 라인별 [레드 점수, 블루 점수], 있으면 시작 배치는 다시 계산하지 않음
+    n_lanes = len(ROLES_KEY)
+    slots = list(red) + list(blue)
+    vecs = dict(zip(slots, score_vectors(players, slots)))
+
+    def slot_scores(l):
+        return [vecs[slots[l]][l], vecs[slots[n_lanes + l]][l]]
+
+    if lane_scores is None or any(None in scores for scores in lane_scores):
+        lane_scores = [slot_scores(l) for l in range(n_lanes)]
+    else:
+        lane_scores = [list(scores) for scores in lane_scores]    # 호출한 쪽 목록은 그대로 둠
+    lane_costs = [pair_cost(r, b) for r, b in lane_scores]
+    gap = sum(r - b for r, b in lane_scores)
+    cost = sum(lane_costs) + GAP_WEIGHT * abs(gap)
+
+    moves = [(i, j) for i in range(2 * n_lanes) for j in range(i + 1, 2 * n_lanes)]
+    if changed is not None:
+        moves.sort(key=lambda m: changed not in m)
+
+    improved = True
+    while improved:
+        improved = False
+        for i, j in moves:
+            slots[i], slots[j] = slots[j], slots[i]
+            touched = {l: slot_scores(l) for l in {i % n_lanes, j % n_lanes}}
+            new_costs = {l: pair_cost(r, b) for l, (r, b) in touched.items()}
+            new_gap = gap
+            new_cost = cost
+            for l, (r, b) in touched.items():
+                new_cost += new_costs[l] - lane_costs[l]
+                new_gap += (r - b) - (lane_scores[l][0] - lane_scores[l][1])
+            new_cost += GAP_WEIGHT * (abs(new_gap) - abs(gap))
+
+            if new_cost < cost:
+                for l, scores in touched.items():
+                    lane_scores[l] = scores
+                    lane_costs[l] = new_costs[l]
+                cost, gap = new_cost, new_gap
+                improved = True
+            else:
+                slots[i], slots[j] = slots[j], slots[i]
+
+    red_total = sum(r for r, _ in lane_scores)
+    blue_total = sum(b for _, b in lane_scores)
+    return Lineup(slots[:n_lanes], slots[n_lanes:], red_total, blue_total, cost, [r - b for r, b in lane_scores])
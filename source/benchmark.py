@@ -0,0 +1,315 @@
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from balancer import ROLES_KEY, WARN_DIFF, DANGER_DIFF, balance, balance_top, lineup_cost
+from scoring import Roster, score_lineups, enumerate_lineups
+from namesearch import NameIndex
+from assignment import ROLE_LABELS
+from core import NO_ROLE, Player, read_players, score_block
+from leaderboard import Leaderboard, COLUMNS
+from storage import atomic_write_json
+
+def make_roster(count, seed=0):
+    # participants.json 과 같은 형식 (Player.to_dict)
+    rng = random.Random(seed)
+    roles = ROLE_LABELS[0]
+    roster = {}
+    for i in range(count):
+        name = f"player{i:05d}"
+        main_role, sub_role = rng.sample([NO_ROLE] + roles, 2)
+        roster[name] = {
+            'name': name,
+            'scores': {role: rng.randint(0, 10) for role in ROLES_KEY},
+            'main_role': main_role,
+            'sub_role': sub_role,
+            'wins': rng.randint(0, 60),
+            'losses': rng.randint(0, 60)
+        }
+    return roster
+
+def make_players(count, seed=0):
+    return {name: Player.from_dict(data) for name, data in make_roster(count, seed).items()}
+
+def timed(func, repeat=1):
+    # 가장 빠른 한 번의 시간 (ms)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def dict_score(players, red_names, blue_names):
+    # refresh_combos / LaneRow.update_ui 와 같은 방식 (선수마다 점수 배열에서 한 칸씩)
+    data = score_block.data
+    red_total = 0
+    blue_total = 0
+    warn = 0
+    danger = 0
+    for l, (r_name, b_name) in enumerate(zip(red_names, blue_names)):
+        r_score = data[players[r_name].offset + l]
+        b_score = data[players[b_name].offset + l]
+        red_total += r_score
+        blue_total += b_score
+        diff = abs(r_score - b_score)
+        if diff >= DANGER_DIFF:
+            danger += 1
+        elif diff >= WARN_DIFF:
+            warn += 1
+    return red_total, blue_total, warn, danger
+
+def bench_scoring(players, count, seed=0):
+    roster = Roster(players)
+    rng = np.random.default_rng(seed)
+    picks = np.argsort(rng.random((count, len(roster))), axis=1)[:, :10]
+    red, blue = picks[:, :5], picks[:, 5:]
+
+    names = roster.names
+    red_names = [[names[i] for i in row] for row in red.tolist()]
+    blue_names = [[names[i] for i in row] for row in blue.tolist()]
+
+    start = time.perf_counter()
+    for r, b in zip(red_names, blue_names):
+        dict_score(players, r, b)
+    dict_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score_lineups(roster.matrix, red, blue)
+    array_time = time.perf_counter() - start
+
+    return {
+        'lineups': count,
+        'dict_per_sec': count / dict_time,
+        'numpy_per_sec': count / array_time,
+        'speedup': dict_time / array_time
+    }
+
+def bench_exhaustive(players):
+    roster = Roster(players)
+    red, blue = enumerate_lineups(range(10))
+
+    start = time.perf_counter()
+    result = score_lineups(roster.matrix, red, blue)
+    array_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lineup = balance(players, roster.names)
+    search_time = time.perf_counter() - start
+
+    best = int(result['cost'].min())
+    assert best == lineup.cost == lineup_cost(roster.matrix[roster.indices(lineup.red), range(5)],
+                                              roster.matrix[roster.indices(lineup.blue), range(5)])
+    return {
+        'lineups': len(red),
+        'numpy_full_scan_ms': array_time * 1000,
+        'branch_and_bound_ms': search_time * 1000,
+        'best_cost': best
+    }
+
+def full_refresh(players, slots):
+    # 예전 refresh_combos: 전체 정렬 + 콤보박스 10개 목록 + 합계를 매번 다시 계산
+    selected = {n for n in slots if n}
+    all_names = sorted(players.keys())
+    options = [[""] + [n for n in all_names if n not in selected or n == current] for current in slots]
+    totals = [0, 0]
+    for slot, name in enumerate(slots):
+        if name:
+            totals[slot // 5] += players[name].score(slot % 5)
+    return options, totals
+
+def bench_selection(players, selections, seed=0):
+    # 자리 하나를 고를 때 드는 시간 (Tk 위젯 설정 제외)
+    rng = random.Random(seed)
+    names = list(players)
+    changes = []
+    slots = [""] * 10
+    for _ in range(selections):
+        slot = rng.randrange(10)
+        # 가끔은 자리를 비움
+        name = "" if rng.random() < 0.1 else rng.choice(names)
+        if name in slots:
+            continue
+        slots[slot] = name
+        changes.append((slot, name))
+
+    slots = [""] * 10
+    start = time.perf_counter()
+    for slot, name in changes:
+        slots[slot] = name
+        full_refresh(players, slots)
+    full_time = time.perf_counter() - start
+
+    index = NameIndex(players)
+    slots = [""] * 10
+    scores = [0] * 10
+    totals = [0, 0]
+    selected = set()
+    cached = [None] * 10
+    start = time.perf_counter()
+    for slot, name in changes:
+        old = slots[slot]
+        selected.discard(old)
+        if name:
+            selected.add(name)
+        slots[slot] = name
+        score = players[name].score(slot % 5) if name else 0
+        totals[slot // 5] += score - scores[slot]
+        scores[slot] = score
+        for i, current in enumerate(slots):
+            options = [""] + index.search("", selected - {current})
+            if options != cached[i]:
+                cached[i] = options
+    incremental_time = time.perf_counter() - start
+
+    return {
+        'players': len(players),
+        'selections': len(changes),
+        'full_ms': full_time / len(changes) * 1000,
+        'incremental_ms': incremental_time / len(changes) * 1000
+    }
+
+def bench_balance(players, samples, seed=0):
+    # 무작위 10명을 골라 최선 1개 / 상위 10개 탐색
+    rng = random.Random(seed)
+    names = list(players)
+    groups = [rng.sample(names, 10) for _ in range(samples)]
+    best_times = []
+    top_times = []
+    for group in groups:
+        best_times.append(timed(lambda: balance(players, group)))
+        top_times.append(timed(lambda: balance_top(players, group, 10)))
+    best_times.sort()
+    top_times.sort()
+    return {
+        'samples': samples,
+        'best_median_ms': best_times[len(best_times) // 2],
+        'best_max_ms': best_times[-1],
+        'top10_median_ms': top_times[len(top_times) // 2],
+        'top10_max_ms': top_times[-1]
+    }
+
+def bench_persistence(roster, repeat=3):
+    # save_data (atomic_write_json) / load_data (read_players) 왕복
+    players = {name: Player.from_dict(data) for name, data in roster.items()}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "participants.json")
+        save_ms = timed(lambda: atomic_write_json(path, {name: p.to_dict() for name, p in players.items()}), repeat)
+        load_ms = timed(lambda: read_players(path), repeat)
+        size = os.path.getsize(path)
+        loaded = read_players(path)
+    assert {name: p.to_dict() for name, p in loaded.items()} == roster
+    return {
+        'save_ms': save_ms,
+        'load_ms': load_ms,
+        'file_bytes': size
+    }
+
+def bench_history(players, repeat=3):
+    # HistoryWindow 정렬: 예전 비교마다 승률 계산 vs Leaderboard 캐시 (전체 생성 / 경기 한 판 반영)
+    def old_sort():
+        sorted(players.values(), key=lambda p: (p.wins + p.losses, p.wins / (p.wins + p.losses) if (p.wins + p.losses) > 0 else 0), reverse=True)
+
+    def build():
+        board = Leaderboard(players)
+        for column in COLUMNS:
+            board.order(column)
+        return board
+
+    board = build()
+    ten = list(players)[:10]
+    return {
+        'lambda_sort_ms': timed(old_sort, repeat),
+        'leaderboard_build_ms': timed(build, repeat),
+        'leaderboard_update_ms': timed(lambda: board.update(ten), repeat)
+    }
+
+def bench_list_ui(players, repeat=3):
+    # update_list_ui 의 사이드바 목록 갱신, 화면이 없으면 xvfb-run 으로 실행
+    try:
+        import customtkinter as ctk
+        gui = importlib.import_module("112")
+        root = ctk.CTk()
+    except Exception as e:
+        return {'skipped': f"{type(e).__name__}: {e}"}
+    try:
+        root.geometry("300x650")
+        player_list = gui.VirtualPlayerList(root, players, lambda name: None, lambda name: None)
+        player_list.pack(fill="both", expand=True)
+        root.update()
+
+        def refresh():
+            player_list.set_names(players.keys())
+            root.update_idletasks()
+
+        return {
+            'update_list_ui_ms': timed(refresh, repeat),
+            'cards': len(player_list.rows)
+        }
+    finally:
+        root.destroy()
+
+def run_suite(sizes, seed=0, lineups=200000, include_ui=True, out=None):
+    # out: 진행 상황을 쓸 곳 (기본 stdout, --json - 일 때는 JSON 과 섞이지 않게 stderr)
+    results = []
+    out = out or sys.stdout
+
+    def add(bench, count, result):
+        result = dict(result, bench=bench, players=count)
+        results.append(result)
+        print(f"{bench:<12} {count:>6}  " + ", ".join(f"{k} {v:.3f}" if isinstance(v, float) else f"{k} {v}"
+                                                     for k, v in result.items() if k not in ("bench", "players")),
+              file=out, flush=True)
+
+    add("exhaustive", 10, bench_exhaustive(make_players(10, seed)))
+    for count in sizes:
+        roster = make_roster(count, seed)
+        players = {name: Player.from_dict(data) for name, data in roster.items()}
+        add("scoring", count, bench_scoring(players, lineups, seed))
+        add("balance", count, bench_balance(players, 5, seed))
+        add("persistence", count, bench_persistence(roster))
+        add("history", count, bench_history(players))
+        add("selection", count, bench_selection(players, 200, seed))
+        if include_ui:
+            add("list_ui", count, bench_list_ui(players))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="5v5 Balancer benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000], help="roster sizes")
+    parser.add_argument("--lineups", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-ui", action="store_true", help="skip the Tk widget benchmark")
+    parser.add_argument("--label", default="", help="release label stored in the JSON output (e.g. v1.1.2)")
+    parser.add_argument("--json", help="write results to this file ('-' for stdout)")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.seed, args.lineups, not args.no_ui,
+                        sys.stderr if args.json == "-" else sys.stdout)
+    if args.json:
+        report = {
+            'label': args.label,
+            'time': datetime.now().isoformat(timespec="seconds"),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'results': results
+        }
+        text = json.dumps(report, indent=4)
+        if args.json == "-":
+            print(text)
+        else:
+            with open(args.json, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+
+if __name__ == "__main__":
+    main()
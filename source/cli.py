@@ -0,0 +1,92 @@
+import argparse
+import json
+import sys
+
+from balancer import ROLES_KEY, WARN_DIFF, DANGER_DIFF, balance_top
+from assignment import balance_by_roles_top
+from core import load_roster, history_games
+from ratings import RatingBook
+from rolestats import RoleStats
+
+# GUI 없이 밸런스 결과를 출력
+#   python cli.py 이름1 이름2 ... 이름10 [--file participants.json] [--top 3]
+#   python cli.py --list
+
+def lane_mark(diff):
+    if diff >= DANGER_DIFF:
+        return "!!"
+    if diff >= WARN_DIFF:
+        return "!"
+    return ""
+
+def print_lineup(rank, lineup, players):
+    print(f"#{rank}  Power {lineup.red_total} : {lineup.blue_total}  (warn {lineup.warn}, danger {lineup.danger})")
+    for l, (role, r_name, b_name) in enumerate(zip(ROLES_KEY, lineup.red, lineup.blue)):
+        r_score = players[r_name].score(l)
+        b_score = players[b_name].score(l)
+        print(f"  {role:<8} {r_name} ({r_score})  vs  {b_name} ({b_score})  {lane_mark(abs(r_score - b_score))}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="5v5 Balancer (command line)")
+    parser.add_argument("names", nargs="*", help="10 player names")
+    parser.add_argument("--file", default="participants.json", help="participants.json or .db")
+    parser.add_argument("--top", type=int, default=3, help="number of lineups to print")
+    parser.add_argument("--roles", action="store_true", help="use main/sub role preference")
+    parser.add_argument("--ratings", action="store_true", help="adjust scores by match history ratings")
+    parser.add_argument("--lane-stats", action="store_true", help="adjust scores by per-lane win rates")
+    parser.add_argument("--json", action="store_true", help="print lineups as JSON")
+    parser.add_argument("--list", action="store_true", help="list players and exit")
+    args = parser.parse_args(argv)
+
+    errors = []
+    try:
+        players, store, match_log = load_roster(args.file, errors)
+    except (OSError, ValueError) as e:
+        print(f"Failed to load {args.file}: {e}", file=sys.stderr)
+        return 1
+    for error in errors:
+        print(f"Skipped {error}", file=sys.stderr)
+
+    try:
+        if args.list:
+            for name in sorted(players):
+                p = players[name]
+                print(f"{name}  " + " ".join(f"{role}:{score}" for role, score in zip(ROLES_KEY, p.vector())) + f"  W{p.wins} L{p.losses}")
+            return 0
+
+        missing = [n for n in args.names if n not in players]
+        if missing:
+            print(f"Unknown players: {', '.join(missing)}", file=sys.stderr)
+            return 1
+        if len(args.names) != 10 or len(set(args.names)) != 10:
+            print("Exactly 10 distinct players required.", file=sys.stderr)
+            return 1
+
+        pool = players
+        games = history_games(store, match_log) if args.ratings or args.lane_stats else []
+        if args.ratings:
+            ratings = RatingBook()
+            ratings.replay(games)
+            pool = ratings.rated_players(pool, args.names)
+        if args.lane_stats:
+            role_stats = RoleStats()
+            role_stats.replay(games)
+            pool = role_stats.weighted_players(pool, args.names)
+
+        if args.roles:
+            lineups = balance_by_roles_top(pool, args.names, args.top)
+        else:
+            lineups = balance_top(pool, args.names, args.top)
+
+        if args.json:
+            print(json.dumps([l.to_dict() for l in lineups], ensure_ascii=False, indent=4))
+        else:
+            for rank, lineup in enumerate(lineups, 1):
+                print_lineup(rank, lineup, pool)
+        return 0
+    finally:
+        if store:
+            store.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import os
+import threading
+from array import array
+
+from balancer import ROLES_KEY, MAX_SCORE
+from assignment import ROLE_LABELS, role_index
+from loader import StreamError, stream_json_object
+from matchlog import MatchLog
+from sqlite_store import SqliteStore, is_sqlite_path
+
+# GUI 없이 쓰는 선수 모델 / 불러오기 (112.py, cli.py 공용)
+NO_ROLE = "선택 안함"
+
+def role_code(label):
+    # 0: 선택 안함, 1~5: ROLES_KEY 순서 (한/영 이름 모두 인식)
+    l = role_index(label) if label else None
+    return 0 if l is None else l + 1
+
+def role_label(code):
+    return ROLE_LABELS[0][code - 1] if code else NO_ROLE
+
+def score_value(score):
+    # 5.0 처럼 정수인 실수는 정수로, 정수가 아니거나 0~MAX_SCORE 밖이면 ValueError
+    if type(score) is float and score.is_integer():
+        score = int(score)
+    if type(score) is not int or not 0 <= score <= MAX_SCORE:
+        raise ValueError(f"invalid score: {score!r}")
+    return score
+
+class ScoreBlock:
+    # 모든 선수의 라인 점수를 이어 붙인 1바이트 배열, 선수 하나가 ROLES_KEY 순서 5칸 (Player.offset + 라인 번호)
+    # 자주 읽는 곳은 score_block.data[player.offset + l] 로 바로 읽음
+    def __init__(self):
+        self.data = array("b")
+        self.free = []      # 없어진 선수의 칸 시작 위치 (다음 선수가 다시 씀)
+        self.lock = threading.RLock()   # 명단은 백그라운드 스레드에서도 읽음
+
+    def add(self, values):
+        values = array("b", map(score_value, values))
+        if len(values) != len(ROLES_KEY):
+            raise ValueError(f"expected {len(ROLES_KEY)} scores")
+        with self.lock:
+            if self.free:
+                offset = self.free.pop()
+                self.data[offset:offset + len(ROLES_KEY)] = values
+            else:
+                offset = len(self.data)
+                self.data.extend(values)
+        return offset
+
+    def release(self, offset):
+        with self.lock:
+            self.free.append(offset)
+
+score_block = ScoreBlock()
+
+class Player:
+    # 대규모 명단용으로 인스턴스 __dict__ 없이 저장 (라인은 정수 코드, 점수는 score_block 의 5칸)
+    __slots__ = ("name", "offset", "main_code", "sub_code", "wins", "losses")
+
+    def __init__(self, name, scores, main_role=NO_ROLE, sub_role=NO_ROLE, wins=0, losses=0):
+        self.name = name
+        self.offset = score_block.add(scores[role] for role in ROLES_KEY)
+        self.main_code = role_code(main_role)
+        self.sub_code = role_code(sub_role)
+        self.wins = wins
+        self.losses = losses
+
+    def __del__(self):
+        try:
+            score_block.release(self.offset)
+        except (AttributeError, TypeError):
+            # 생성 도중 실패했거나 종료 중
+            pass
+
+    def score(self, lane):
+        # lane: ROLES_KEY 순서 번호
+        return score_block.data[self.offset + lane]
+
+    def vector(self):
+        # balancer.score_vectors 용 (라인 이름 조회 없이 바로)
+        return tuple(score_block.data[self.offset:self.offset + len(ROLES_KEY)])
+
+    @property
+    def scores(self):
+        # {라인: 점수} 사본 (수정해도 선수에는 반영 안 됨), 반복해서 읽는 곳은 score / vector 사용
+        return dict(zip(ROLES_KEY, self.vector()))
+
+    @property
+    def main_role(self):
+        return role_label(self.main_code)
+
+    @property
+    def sub_role(self):
+        return role_label(self.sub_code)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'scores': self.scores,
+            'main_role': self.main_role,
+            'sub_role': self.sub_role,
+            'wins': self.wins,
+            'losses': self.losses
+        }
+
+    @staticmethod
+    def from_dict(data):
+        return Player(
+            data['name'],
+            data['scores'],
+            data.get('main_role', NO_ROLE),
+            data.get('sub_role', NO_ROLE),
+            data.get('wins', 0),    # 하위 호환성 (기존 데이터 없을 시 0)
+            data.get('losses', 0)
+        )
+
+def parse_player(key, data):
+    # 파일의 한 항목 검사, 잘못된 항목은 ValueError (이유)
+    if not isinstance(data, dict):
+        raise ValueError("entry is not an object")
+    name = data.get('name', key)
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("missing name")
+    scores = data.get('scores')
+    if not isinstance(scores, dict):
+        raise ValueError("missing scores")
+    for role in ROLES_KEY:
+        try:
+            score_value(scores.get(role))
+        except ValueError:
+            raise ValueError(f"invalid {role} score: {scores.get(role)!r}") from None
+    for field in ('wins', 'losses'):
+        value = data.get(field, 0)
+        if type(value) is not int or value < 0:
+            raise ValueError(f"invalid {field}: {value!r}")
+    return Player.from_dict(dict(data, name=name))
+
+def merge_player(players, player):
+    # 같은 이름이 이미 있으면 점수/라인은 먼저 읽은 것을 두고 승/패만 합침
+    existing = players.get(player.name)
+    if existing is None:
+        players[player.name] = player
+        return False
+    existing.wins += player.wins
+    existing.losses += player.losses
+    return True
+
+def read_players(path, errors=None, progress=None, players=None):
+    # 조각씩 읽으면서 항목마다 검사, 잘못된 항목은 errors 에 남기고 건너뜀
+    # progress(0~1) 는 1% 단위로만 호출
+    players = {} if players is None else players
+    source = os.path.basename(path)
+    step = -1
+    try:
+        for key, data, fraction in stream_json_object(path):
+            try:
+                merge_player(players, parse_player(key, data))
+            except ValueError as e:
+                if errors is None:
+                    raise ValueError(f"{source}: {key}: {e}") from None
+                errors.append(f"{source}: {key}: {e}")
+            if progress and int(fraction * 100) != step:
+                step = int(fraction * 100)
+                progress(fraction)
+    except StreamError as e:
+        if errors is None:
+            raise
+        errors.append(f"{source}: {e} (stopped reading)")
+    if progress:
+        progress(1.0)
+    return players
+
+def load_roster(path, errors=None, progress=None):
+    # 반환값: (선수 dict, SqliteStore 또는 None, MatchLog)
+    # JSON 은 스냅샷 이후 경기 기록까지 반영, 파일이 없으면 빈 목록
+    match_log = MatchLog(path)
+    if is_sqlite_path(path):
+        store = SqliteStore(path)
+        return store.load_players(Player.from_dict), store, match_log
+
+    players = read_players(path, errors, progress) if os.path.exists(path) else {}
+    match_log.replay(players)
+    return players, None, match_log
+
+def merge_rosters(paths, errors=None, progress=None):
+    # 여러 JSON 파일을 하나로 (이름이 같으면 승/패 합산), 파일마다 남은 경기 기록도 반영
+    # 반환값: (선수 dict, 전체 경기 기록)
+    players = {}
+    games = []
+    for i, path in enumerate(paths):
+        def file_progress(fraction, i=i):
+            if progress:
+                progress((i + fraction) / len(paths))
+        read_players(path, errors, file_progress, players)
+        match_log = MatchLog(path)
+        match_log.replay(players)
+        games.extend(match_log.games())
+    games.sort(key=lambda g: g.get('time', ""))
+    return players, games
+
+def history_games(store, match_log):
+    # 전체 경기 기록 (MatchLog.games 형식)
+    if store:
+        return store.games()
+    return match_log.games()
@@ -0,0 +1,68 @@
+import bisect
+
+# HistoryWindow 컬럼 (정렬 기준)
+COLUMNS = ["Name", "Matches", "Wins", "Losses", "Win Rate"]
+DEFAULT_COLUMN = "Matches"
+
+def win_rate(player):
+    total = player.wins + player.losses
+    return player.wins / total if total > 0 else 0
+
+def sort_key(player, column):
+    # 값이 같으면 뒤의 항목으로 순서를 정함 (이름은 목록에서 따로 붙음)
+    total = player.wins + player.losses
+    if column == "Name":
+        return (player.name,)
+    if column == "Matches":
+        return (total, win_rate(player))
+    if column == "Wins":
+        return (player.wins, win_rate(player))
+    if column == "Losses":
+        return (player.losses, -player.wins)
+    if column == "Win Rate":
+        return (win_rate(player), total)
+    raise ValueError(f"Unknown column: {column}")
+
+class Leaderboard:
+    # 컬럼별 정렬 결과를 한 번만 만들고, 경기 기록/선수 수정 때는 바뀐 선수만 다시 끼워 넣음
+    def __init__(self, participants):
+        self.participants = participants
+        self.orders = {}    # 컬럼 -> 오름차순 [(정렬 키, 이름)]
+        self.keys = {}      # 컬럼 -> {이름: 정렬 키}
+
+    def __len__(self):
+        return len(self.participants)
+
+    def invalidate(self):
+        # 선수 목록 전체가 바뀌었을 때 (파일 불러오기 등)
+        self.orders.clear()
+        self.keys.clear()
+
+    def order(self, column):
+        if column not in self.orders:
+            keys = {name: sort_key(p, column) for name, p in self.participants.items()}
+            self.keys[column] = keys
+            self.orders[column] = sorted((key, name) for name, key in keys.items())
+        return self.orders[column]
+
+    def update(self, names):
+        # names: 승/패나 이름이 바뀐 선수 (지워진 선수는 목록에서 빠짐)
+        for column, entries in self.orders.items():
+            keys = self.keys[column]
+            for name in set(names):
+                old = keys.pop(name, None)
+                if old is not None:
+                    i = bisect.bisect_left(entries, (old, name))
+                    if i < len(entries) and entries[i] == (old, name):
+                        del entries[i]
+                player = self.participants.get(name)
+                if player is not None:
+                    key = sort_key(player, column)
+                    keys[name] = key
+                    bisect.insort(entries, (key, name))
+
+    def row(self, column, descending, index):
+        entries = self.order(column)
+        if descending:
+            index = len(entries) - 1 - index
+        return self.participants[entries[index][1]]
@@ -0,0 +1,94 @@
+import json
+import os
+from collections import OrderedDict
+
+from balancer import Lineup, score_vector
+from storage import atomic_write_json
+
+# 같은 10명으로 다시 밸런스를 돌릴 때 이전 결과를 바로 돌려주는 캐시 (participants.json 옆에 저장)
+CACHE_SIZE = 200
+CACHE_VERSION = 2
+
+def cache_path(roster_path):
+    base, _ = os.path.splitext(roster_path)
+    return base + ".lineups.json"
+
+def player_stamp(player):
+    # 결과에 영향을 주는 값 (라인별 점수 + 주/부 라인), 이 값이 달라지면 저장된 결과는 버림
+    return tuple(score_vector(player)) + (player.main_code, player.sub_code)
+
+class LineupCache:
+    def __init__(self, roster_path, size=CACHE_SIZE):
+        self.path = cache_path(roster_path)
+        self.size = size
+        # (모드, 정렬된 이름) -> (stamp, k, [Lineup.to_dict ...]), 오래 안 쓴 것이 앞쪽
+        self.entries = OrderedDict()
+
+    @staticmethod
+    def key(names, mode):
+        return mode, tuple(sorted(names))
+
+    @staticmethod
+    def stamp(players, names):
+        return tuple(player_stamp(players[name]) for name in sorted(names))
+
+    def get(self, players, names, mode, k):
+        # 저장된 결과가 k개 이상이고 점수/라인이 그대로일 때만 반환, 아니면 None
+        key = self.key(names, mode)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        stamp, found_k, lineups = entry
+        if found_k < k or stamp != self.stamp(players, names):
+            return None
+        self.entries.move_to_end(key)
+        return [Lineup(**data) for data in lineups[:k]]
+
+    def put(self, players, names, mode, k, lineups):
+        key = self.key(names, mode)
+        self.entries[key] = (self.stamp(players, names), k, [lineup.to_dict() for lineup in lineups])
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, name):
+        # 선수 수정/삭제 시 그 선수가 들어간 결과를 모두 버림, 버린 개수 반환
+        stale = [key for key in self.entries if name in key[1]]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+    def clear(self):
+        self.entries.clear()
+
+    def to_json(self):
+        # 백그라운드 저장용 스냅샷 (오래된 것부터)
+        return {
+            'version': CACHE_VERSION,
+            'entries': [
+                {'mode': mode, 'names': list(names), 'stamp': [list(s) for s in stamp], 'k': k, 'lineups': lineups}
+                for (mode, names), (stamp, k, lineups) in self.entries.items()
+            ]
+        }
+
+    def load(self):
+        # 파일이 없거나 형식이 다르면 빈 캐시로 시작
+        self.entries.clear()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get('version') != CACHE_VERSION:
+                return 0
+            for entry in data['entries'][-self.size:]:
+                key = self.key(entry['names'], entry['mode'])
+                stamp = tuple(tuple(s) for s in entry['stamp'])
+                self.entries[key] = (stamp, entry['k'], entry['lineups'])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Lineup cache ignored: {e}")
+            self.entries.clear()
+        return len(self.entries)
+
+    def save(self):
+        atomic_write_json(self.path, self.to_json())
@@ -0,0 +1,83 @@
+import json
+import os
+
+# participants.json 을 한 번에 json.load 하지 않고 조각씩 읽음
+CHUNK_SIZE = 1 << 16
+WHITESPACE = " \t\r\n"
+
+_decoder = json.JSONDecoder()
+
+class StreamError(ValueError):
+    # 파일 구조가 깨져서 더 읽을 수 없음 (이미 읽은 항목은 유효)
+    pass
+
+def stream_json_object(path, chunk_size=CHUNK_SIZE):
+    # 최상위가 {"이름": {...}, ...} 인 파일의 (키, 값, 읽은 비율) 을 하나씩 반환
+    # 값 하나가 파일 전체보다 작으면 메모리에는 조각 + 항목 하나만 올라감
+    total = os.path.getsize(path) or 1
+    with open(path, "r", encoding="utf-8-sig") as f:
+        buf = ""
+        pos = 0
+        eof = False
+        consumed = 0    # 버퍼 앞에서 잘라낸 글자 수 (진행률 계산용, 대략적인 바이트 위치)
+
+        def fill():
+            nonlocal buf, pos, eof, consumed
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            consumed += pos
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_ws():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in WHITESPACE:
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    return
+
+        def expect(chars):
+            nonlocal pos
+            skip_ws()
+            if pos >= len(buf):
+                raise StreamError("Unexpected end of file")
+            ch = buf[pos]
+            if ch not in chars:
+                raise StreamError(f"Expected {' or '.join(repr(c) for c in chars)} at offset {consumed + pos}")
+            pos += 1
+            return ch
+
+        def decode():
+            nonlocal pos
+            skip_ws()
+            while True:
+                try:
+                    value, end = _decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    # 버퍼 끝에서 잘렸으면 더 읽고 다시 시도
+                    if not eof and fill():
+                        continue
+                    raise StreamError(f"{e.msg} at offset {consumed + e.pos}") from None
+                # 숫자는 버퍼 끝에서 끊겨도 성공하므로 뒤에 글자가 더 있을 때만 확정
+                if end >= len(buf) and not eof and fill():
+                    continue
+                pos = end
+                return value
+
+        expect("{")
+        skip_ws()
+        if pos < len(buf) and buf[pos] == "}":
+            return
+        while True:
+            key = decode()
+            if not isinstance(key, str):
+                raise StreamError(f"Expected a player name at offset {consumed + pos}")
+            expect(":")
+            value = decode()
+            yield key, value, min(1.0, (consumed + pos) / total)
+            if expect(",}") == "}":
+                return
@@ -0,0 +1,158 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from balancer import ROLES_KEY, PENALTY, GAP_WEIGHT, WARN_WEIGHT, Lineup, score_vectors, search_vectors
+
+MATCH_SIZE = 10
+RESTART_TIME = 0.5      # 재시작 한 번(프로세스 작업 하나)에 쓰는 시간(초)
+MIN_RESTART_TIME = 0.05
+CANCEL_POLL = 0.05      # 취소 요청을 확인하는 주기(초)
+
+class LobbyResult:
+    def __init__(self, matches, bench, cost):
+        self.matches = matches  # Lineup 목록
+        self.bench = bench      # 인원이 10의 배수가 아닐 때 쉬는 선수
+        self.cost = cost
+
+def match_cost(vecs, slots, m):
+    # slots[m*10 : m*10+5] 레드, [m*10+5 : m*10+10] 레드와 같은 라인 순서의 블루
+    # 숙련도 비용은 넣지 않음: 넣으면 약한 선수를 쉬게 할수록 비용이 내려가서 쉬는 선수가 한쪽으로 쏠림
+    # (경기 안의 라인 배치는 마지막에 search_vectors 로 숙련도까지 보고 다듬음)
+    base = m * MATCH_SIZE
+    cost = 0
+    gap = 0
+    for l in range(len(ROLES_KEY)):
+        r = vecs[slots[base + l]][l]
+        b = vecs[slots[base + 5 + l]][l]
+        cost += PENALTY[abs(r - b)]
+        gap += r - b
+    return cost + GAP_WEIGHT * abs(gap)
+
+def anneal(vecs, n_matches, seed, duration, start=None):
+    # 슬롯 두 개를 바꾸는 담금질 (경기 간 이동, 쉬는 선수 교체 포함)
+    rng = random.Random(seed)
+    slots = list(start) if start else rng.sample(range(len(vecs)), len(vecs))
+    n_active = n_matches * MATCH_SIZE
+    n_slots = len(slots)
+
+    costs = [match_cost(vecs, slots, m) for m in range(n_matches)]
+    total = sum(costs)
+    best_total, best_slots = total, slots[:]
+
+    # 위험 라인은 거의 되돌리지 않고, 주의 라인 이하만 넘나들 수 있는 온도에서 시작
+    temp_start = WARN_WEIGHT
+    temp_end = 1.0
+    begin = time.monotonic()
+    temp = temp_start
+    step = 0
+    while True:
+        step += 1
+        if step % 256 == 0:
+            progress = (time.monotonic() - begin) / duration
+            if progress >= 1:
+                break
+            temp = temp_start * (temp_end / temp_start) ** progress
+
+        a = rng.randrange(n_active)
+        b = rng.randrange(n_slots - 1)
+        if b >= a:
+            b += 1
+        ma = a // MATCH_SIZE
+        mb = b // MATCH_SIZE if b < n_active else -1
+        if vecs[slots[a]] == vecs[slots[b]]:
+            continue
+
+        slots[a], slots[b] = slots[b], slots[a]
+        new_a = match_cost(vecs, slots, ma)
+        delta = new_a - costs[ma]
+        if mb >= 0 and mb != ma:
+            new_b = match_cost(vecs, slots, mb)
+            delta += new_b - costs[mb]
+
+        if delta <= 0 or rng.random() < math.exp(-delta / temp):
+            costs[ma] = new_a
+            if mb >= 0 and mb != ma:
+                costs[mb] = new_b
+            total += delta
+            if total < best_total:
+                best_total, best_slots = total, slots[:]
+        else:
+            slots[a], slots[b] = slots[b], slots[a]
+
+    # 경기마다 10명이 정해졌으니 팀 분배/라인은 정확한 탐색으로 다듬는다
+    for m in range(n_matches):
+        base = m * MATCH_SIZE
+        members = best_slots[base:base + MATCH_SIZE]
+        cost, red_idx, blue_idx = search_vectors([vecs[p] for p in members], 1)[0]
+        best_slots[base:base + 5] = [members[p] for p in red_idx]
+        best_slots[base + 5:base + MATCH_SIZE] = [members[q] for q in blue_idx]
+    best_total = sum(match_cost(vecs, best_slots, m) for m in range(n_matches))
+    return best_total, best_slots
+
+def build_result(names, vecs, n_matches, total, slots):
+    matches = []
+    for m in range(n_matches):
+        base = m * MATCH_SIZE
+        red = [names[p] for p in slots[base:base + 5]]
+        blue = [names[p] for p in slots[base + 5:base + MATCH_SIZE]]
+        red_vec = [vecs[p][l] for l, p in enumerate(slots[base:base + 5])]
+        blue_vec = [vecs[p][l] for l, p in enumerate(slots[base + 5:base + MATCH_SIZE])]
+        matches.append(Lineup.from_vectors(red, blue, red_vec, blue_vec))
+    bench = sorted(names[p] for p in slots[n_matches * MATCH_SIZE:])
+    return LobbyResult(matches, bench, total)
+
+def balance_lobby(players, names, time_budget=3.0, workers=None, progress=None, cancel=None):
+    # 참가자 전체를 10명씩 여러 경기로 나눈다. 여러 코어에서 담금질을 반복하며
+    # 시간 예산이 끝나면 지금까지 찾은 최선의 결과를 반환 (progress 로 중간 결과 전달)
+    # cancel(threading.Event) 이 설정되면 새 작업을 그만두고 그때까지의 최선을 반환
+    names = list(names)
+    if len(set(names)) != len(names):
+        raise ValueError("Duplicate player names.")
+    n_matches = len(names) // MATCH_SIZE
+    if n_matches < 1:
+        raise ValueError("At least 10 players required.")
+
+    vecs = score_vectors(players, names)
+    if len(names) == MATCH_SIZE:
+        _, red_idx, blue_idx = search_vectors(vecs, 1)[0]
+        slots = red_idx + blue_idx
+        best = build_result(names, vecs, 1, match_cost(vecs, slots, 0), slots)
+        if progress:
+            progress(best)
+        return best
+
+    workers = workers or os.cpu_count() or 1
+    deadline = time.monotonic() + time_budget
+    # 시간이 아주 짧거나 바로 취소돼도 돌려줄 결과가 있도록 짧은 담금질 한 번은 여기서
+    total, best_slots = anneal(vecs, n_matches, 0, MIN_RESTART_TIME)
+    best = build_result(names, vecs, n_matches, total, best_slots)
+    if progress:
+        progress(best)
+    seed = 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        while True:
+            remaining = deadline - time.monotonic()
+            while len(pending) < workers and remaining > MIN_RESTART_TIME:
+                # 절반은 무작위 시작, 절반은 현재 최선에서 다시 시작
+                start = best_slots if best_slots and seed % 2 else None
+                pending.add(pool.submit(anneal, vecs, n_matches, seed, min(RESTART_TIME, remaining), start))
+                seed += 1
+            if not pending or best.cost == 0 or (cancel and cancel.is_set()):
+                break
+
+            done, pending = wait(pending, timeout=CANCEL_POLL, return_when=FIRST_COMPLETED)
+            for future in done:
+                total, slots = future.result()
+                if total < best.cost:
+                    best_slots = slots
+                    best = build_result(names, vecs, n_matches, total, slots)
+                    if progress:
+                        progress(best)
+        pool.shutdown(cancel_futures=True)
+
+    return best
@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from balancer import ROLES_KEY
+from storage import atomic_write_json
+
+# 마지막 스냅샷 이후 이 경기 수 만큼 쌓이면 participants.json 을 다시 저장
+COMPACT_EVERY = 20
+
+def journal_path(roster_path):
+    base, _ = os.path.splitext(roster_path)
+    return base + ".matches.jsonl"
+
+def snapshot_mark_path(roster_path):
+    base, _ = os.path.splitext(roster_path)
+    return base + ".snapshot.json"
+
+class MatchLog:
+    # 경기 결과를 한 줄씩 덧붙이는 기록 (participants.json 옆에 저장)
+    # {"type": "compact", "games": N} 줄은 처음 N 경기가 participants.json 의 wins/losses 에 반영됐다는 표시
+    # (스냅샷은 백그라운드에서 저장되므로 줄 위치가 아니라 경기 수로 구분)
+    # {"type": "rename", "old": 이전 이름, "new": 새 이름} 줄은 그 앞의 경기를 읽을 때 이름을 바꿔서 읽으라는 표시
+    # compact 줄은 스냅샷을 저장한 뒤에 덧붙이므로, 그 사이에 꺼지는 경우를 위해 스냅샷 파일로 바꾸기 직전에
+    # <이름>.snapshot.json 에 (경기 수, 스냅샷 파일 크기/수정 시각)을 먼저 남김 (mark_snapshot / snapshot_games)
+    # 바꾸기 전에 꺼질 수도 있으므로 지금 파일의 표시도 같이 남겨 둠
+    def __init__(self, roster_path):
+        self.path = journal_path(roster_path)
+        self.roster_path = roster_path
+        self.mark_path = snapshot_mark_path(roster_path)
+        self.total_games = 0
+        self.compacted_games = 0
+        self.lock = threading.RLock()
+
+    @property
+    def pending(self):
+        # 스냅샷에 아직 반영 안 된 경기 수
+        return self.total_games - self.compacted_games
+
+    def append_entry(self, entry):
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def append_game(self, red, blue, winner, red_power, blue_power):
+        self.append_entry({
+            'type': "game",
+            'time': datetime.now().isoformat(timespec="seconds"),
+            'lanes': ROLES_KEY,
+            'red': red,
+            'blue': blue,
+            'winner': winner,
+            'red_power': red_power,
+            'blue_power': blue_power
+        })
+        self.total_games += 1
+
+    def append_rename(self, old_name, new_name):
+        # 선수 이름을 바꾸면 지난 경기도 새 이름으로 읽히도록 (기록 파일은 덧붙이기만 함)
+        if old_name != new_name:
+            self.append_entry({'type': "rename", 'old': old_name, 'new': new_name,
+                               'time': datetime.now().isoformat(timespec="seconds")})
+
+    def mark_snapshot(self, tmp_path, games):
+        # BackgroundWriter 의 before_replace: 다 쓴 스냅샷 임시 파일에 games 경기가 반영됐다고 기록
+        # (이름을 바꿔도 크기/수정 시각은 그대로라서 나중에 같은 파일인지 확인 가능)
+        st = os.stat(tmp_path)
+        current = self.current_mark()
+        marks = ([current] if current else []) + [{'games': games, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}]
+        atomic_write_json(self.mark_path, marks)
+
+    def current_mark(self):
+        # 지금의 participants.json 을 가리키는 표시, 없으면 None
+        try:
+            with open(self.mark_path, "r", encoding="utf-8") as f:
+                marks = json.load(f)
+            st = os.stat(self.roster_path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(marks, list):
+            return None
+        for mark in reversed(marks):
+            if (isinstance(mark, dict) and type(mark.get('games')) is int
+                    and mark.get('size') == st.st_size and mark.get('mtime_ns') == st.st_mtime_ns):
+                return mark
+        return None
+
+    def snapshot_games(self):
+        # 지금의 participants.json 에 반영된 경기 수 (표시가 없으면 0)
+        mark = self.current_mark()
+        return mark['games'] if mark else 0
+
+    def mark_compacted(self, games=None):
+        # games: 저장된 스냅샷에 포함된 경기 수 (스냅샷을 만들 당시의 total_games)
+        # 저장 스레드에서 불리므로 확인과 기록을 한 번에 처리
+        with self.lock:
+            games = self.total_games if games is None else games
+            if games > self.compacted_games:
+                self.append_entry({'type': "compact", 'games': games,
+                                   'time': datetime.now().isoformat(timespec="seconds")})
+                self.compacted_games = games
+
+    def import_games(self, games):
+        # 다른 기록의 경기를 이 기록으로 옮김 (새로 시작, 승/패는 이미 반영된 것으로 표시)
+        with self.lock:
+            with open(self.path, "w", encoding="utf-8") as f:
+                for game in games:
+                    f.write(json.dumps(game, ensure_ascii=False) + "\n")
+                f.write(json.dumps({'type': "compact", 'games': len(games),
+                                    'time': datetime.now().isoformat(timespec="seconds")}, ensure_ascii=False) + "\n")
+            self.total_games = len(games)
+            self.compacted_games = len(games)
+
+    def entries(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 마지막 줄
+                    continue
+
+    def read(self):
+        # 반환값: (경기 목록, 스냅샷에 반영된 경기 수), 이름 바꾸기는 그 앞의 경기에 적용
+        games = []
+        compacted = 0
+        for entry in self.entries():
+            kind = entry.get('type')
+            if kind == "compact":
+                compacted = entry.get('games', len(games))
+            elif kind == "game":
+                games.append(entry)
+            elif kind == "rename":
+                rename_players(games, entry['old'], entry['new'])
+        # 스냅샷은 바뀌었는데 compact 줄을 남기기 전에 꺼졌던 경우
+        compacted = max(compacted, min(self.snapshot_games(), len(games)))
+        return games, compacted
+
+    def games(self):
+        return self.read()[0]
+
+    def replay(self, participants):
+        # 마지막 스냅샷 이후의 경기를 wins/losses 에 다시 반영
+        games, compacted = self.read()
+
+        tail = games[compacted:]
+        for game in tail:
+            apply_result(participants, game['red'], game['blue'], game['winner'])
+        self.total_games = len(games)
+        self.compacted_games = compacted
+        return len(tail)
+
+def apply_result(participants, red, blue, winner):
+    winners, losers = (red, blue) if winner == "RED" else (blue, red)
+    for name in winners:
+        if name in participants:
+            participants[name].wins += 1
+    for name in losers:
+        if name in participants:
+            participants[name].losses += 1
+
+def rename_players(games, old_name, new_name):
+    for game in games:
+        for side in ('red', 'blue'):
+            if old_name in game[side]:
+                game[side] = [new_name if name == old_name else name for name in game[side]]
+
+def game_teams(game):
+    # 기록된 경기의 (레드, 블루) 를 ROLES_KEY 라인 순서로
+    lanes = game.get('lanes', ROLES_KEY)
+    if list(lanes) == ROLES_KEY:
+        return game['red'], game['blue']
+    order = [lanes.index(role) for role in ROLES_KEY]
+    return [game['red'][i] for i in order], [game['blue'][i] for i in order]
@@ -0,0 +1,87 @@
+import bisect
+
+# 라인 콤보박스 드롭다운에 한 번에 보여줄 최대 이름 수
+PICKER_LIMIT = 30
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_FIRST = 0xAC00   # 가
+HANGUL_LAST = 0xD7A3    # 힣
+JUNG_JONG = 21 * 28     # 초성 하나당 음절 수
+
+def fold(text):
+    return text.casefold()
+
+def chosung(text):
+    # "홍길동" -> "ㅎㄱㄷ", 한글 음절이 아닌 글자는 그대로 (소문자)
+    out = []
+    for ch in fold(text):
+        code = ord(ch)
+        if HANGUL_FIRST <= code <= HANGUL_LAST:
+            out.append(CHOSUNG[(code - HANGUL_FIRST) // JUNG_JONG])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+def is_chosung_query(query):
+    # 자음만 입력한 검색어 ("ㅎㄱ") 는 이름의 초성과 비교
+    return any(ch in CHOSUNG for ch in query) and chosung(query) == query
+
+class NameIndex:
+    # 이름 검색: 앞부분 일치 (bisect) > 초성 앞부분 일치 > 중간 일치 순으로 반환
+    def __init__(self, names=()):
+        self.set_names(names)
+
+    def set_names(self, names):
+        self.names = sorted(names)
+        self.keys = sorted((fold(n), n) for n in self.names)
+        self.chosung_keys = sorted((chosung(n), n) for n in self.names)
+
+    def add(self, name):
+        bisect.insort(self.names, name)
+        bisect.insort(self.keys, (fold(name), name))
+        bisect.insort(self.chosung_keys, (chosung(name), name))
+
+    def remove(self, name):
+        for entries, entry in ((self.names, name), (self.keys, (fold(name), name)),
+                               (self.chosung_keys, (chosung(name), name))):
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+
+    def search(self, query, exclude=(), limit=PICKER_LIMIT):
+        # exclude: 이미 다른 자리에 배치된 이름
+        query = fold(query.strip())
+        results = []
+        if not query:
+            for name in self.names:
+                if name not in exclude:
+                    results.append(name)
+                    if len(results) >= limit:
+                        break
+            return results
+
+        seen = set()
+
+        def take(entries, match):
+            for key, name in entries:
+                if len(results) >= limit:
+                    return
+                if name not in seen and name not in exclude and match(key):
+                    seen.add(name)
+                    results.append(name)
+
+        take(self.prefix_range(self.keys, query), lambda key: True)
+        use_chosung = is_chosung_query(query)
+        if use_chosung:
+            take(self.prefix_range(self.chosung_keys, query), lambda key: True)
+        take(self.keys, lambda key: query in key)
+        if use_chosung:
+            take(self.chosung_keys, lambda key: query in key)
+        return results
+
+    @staticmethod
+    def prefix_range(entries, prefix):
+        i = bisect.bisect_left(entries, (prefix,))
+        while i < len(entries) and entries[i][0].startswith(prefix):
+            yield entries[i]
+            i += 1
@@ -0,0 +1,110 @@
+import cProfile
+import functools
+import json
+import os
+import pstats
+import time
+from collections import deque
+from datetime import datetime
+
+# 느린 곳을 찾기 위한 처리 시간 측정 (기본은 꺼져 있고, 꺼져 있으면 함수를 감싸지도 않음)
+#   BALANCER_PROFILE=1          측정 + 창에서 Ctrl+Shift+P 로 오버레이 표시
+#   BALANCER_PROFILE=경로.json  위와 같고 종료할 때 통계를 그 파일에 저장
+#   Ctrl+Shift+R                다음 동작 한 번을 cProfile 로 기록 (profile-라벨-시각.prof / .txt)
+PROFILE_ENV = os.environ.get("BALANCER_PROFILE", "")
+SAMPLE_WINDOW = 200     # 라벨별로 최근 이 횟수 만큼만 보관
+CAPTURE_LINES = 30      # .txt 에 남길 함수 수 (누적 시간 순)
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+class Profiler:
+    def __init__(self, enabled=False, window=SAMPLE_WINDOW):
+        self.enabled = enabled
+        self.window = window
+        self.samples = {}       # 라벨 -> 최근 처리 시간(초)
+        self.depth = 0
+        self.capture = False    # 다음 바깥쪽 호출을 cProfile 로 기록
+        self.idle_hook = None   # Tk after_idle, 있으면 화면 갱신이 끝날 때까지의 시간도 "라벨 +tk" 로 기록
+
+    def record(self, label, seconds):
+        if not self.enabled:
+            return
+        samples = self.samples.get(label)
+        if samples is None:
+            samples = self.samples[label] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def stats(self, label):
+        # ms 단위 (횟수, 중앙값, p90, p99, 최대)
+        values = sorted(self.samples[label])
+        return {
+            'count': len(values),
+            'p50_ms': percentile(values, 0.5) * 1000,
+            'p90_ms': percentile(values, 0.9) * 1000,
+            'p99_ms': percentile(values, 0.99) * 1000,
+            'max_ms': values[-1] * 1000
+        }
+
+    def report(self):
+        return {label: self.stats(label) for label in sorted(self.samples)}
+
+    def format_report(self):
+        lines = [f"{'':<22}{'n':>5}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}"]
+        for label, s in self.report().items():
+            lines.append(f"{label:<22}{s['count']:>5}{s['p50_ms']:>9.1f}{s['p90_ms']:>9.1f}"
+                         f"{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}")
+        return "\n".join(lines)
+
+    def arm(self):
+        self.capture = True
+
+    def call(self, label, func, args, kwargs):
+        outer = self.depth == 0
+        profile = None
+        if outer and self.capture:
+            self.capture = False
+            profile = cProfile.Profile()
+            profile.enable()
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(label, time.perf_counter() - start)
+            self.depth -= 1
+            if profile:
+                profile.disable()
+                self.save_capture(label, profile)
+            if outer and self.idle_hook:
+                self.idle_hook(lambda: self.record(label + " +tk", time.perf_counter() - start))
+
+    def save_capture(self, label, profile):
+        base = f"profile-{label.replace(' ', '_')}-{datetime.now():%Y%m%d-%H%M%S}"
+        profile.dump_stats(base + ".prof")
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            pstats.Stats(profile, stream=f).sort_stats("cumulative").print_stats(CAPTURE_LINES)
+        print(f"Profile saved: {base}.prof")
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({'time': datetime.now().isoformat(timespec="seconds"), 'stats': self.report()}, f, indent=4)
+
+profiler = Profiler(PROFILE_ENV not in ("", "0"))
+
+def profiled(label):
+    # 측정이 꺼져 있으면 원래 함수를 그대로 반환
+    def decorate(func):
+        if not profiler.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return profiler.call(label, func, args, kwargs)
+        return wrapper
+    return decorate
+
+def dump_path():
+    # BALANCER_PROFILE 에 파일 경로를 준 경우
+    return PROFILE_ENV if PROFILE_ENV not in ("", "0", "1") else None
@@ -0,0 +1,95 @@
+from balancer import ROLES_KEY, MAX_SCORE
+from matchlog import game_teams
+
+# 경기 기록에서 배우는 Elo 레이팅 (선수 전체 + 선수별 라인)
+BASE_RATING = 1500
+K_FACTOR = 32
+RATING_PER_POINT = 100  # 레이팅 100 ≈ 숙련도 1점
+MAX_ADJUSTMENT = 3      # 레이팅으로 숙련도를 올리거나 내리는 최대 점수
+
+class RatedPlayer:
+    # 점수만 레이팅으로 보정한 선수 (나머지 속성은 원래 선수 그대로)
+    def __init__(self, player, scores):
+        self.player = player
+        self.scores = scores
+
+    def __getattr__(self, name):
+        return getattr(self.player, name)
+
+    def score(self, lane):
+        # 원래 선수의 score / vector 대신 보정한 점수로
+        return self.scores[ROLES_KEY[lane]]
+
+    def vector(self):
+        return tuple(self.scores[role] for role in ROLES_KEY)
+
+class RatingBook:
+    def __init__(self):
+        self.overall = {}   # 이름 -> 레이팅
+        self.roles = {}     # (이름, 라인 번호) -> 레이팅
+        self.games = 0
+
+    def clear(self):
+        self.overall.clear()
+        self.roles.clear()
+        self.games = 0
+
+    def lane_rating(self, name, lane):
+        # 라인 레이팅은 그 라인을 해본 만큼만 움직이므로 전체 레이팅과 반씩 섞음
+        overall = self.overall.get(name, BASE_RATING)
+        role = self.roles.get((name, lane), BASE_RATING)
+        return (overall + role) / 2
+
+    def adjustment(self, name, lane):
+        # 숙련도 점수에 더할 값 (점수 단위)
+        points = (self.lane_rating(name, lane) - BASE_RATING) / RATING_PER_POINT
+        return min(MAX_ADJUSTMENT, max(-MAX_ADJUSTMENT, points))
+
+    def team_strength(self, team, power):
+        # 입력 숙련도(Power) 로 예상되는 실력 + 레이팅이 배운 차이 (라인 평균, 레이팅 단위)
+        n_lanes = len(ROLES_KEY)
+        learned = sum(self.lane_rating(name, l) - BASE_RATING for l, name in enumerate(team))
+        return (learned + RATING_PER_POINT * (power or 0)) / n_lanes
+
+    def expected(self, red, blue, red_power=0, blue_power=0):
+        # 레드 승리 확률
+        diff = self.team_strength(red, red_power) - self.team_strength(blue, blue_power)
+        return 1 / (1 + 10 ** (-diff / 400))
+
+    def record(self, red, blue, winner, red_power=0, blue_power=0):
+        # 한 경기 반영 (10명 x 전체/라인 레이팅)
+        delta = K_FACTOR * ((1 if winner == "RED" else 0) - self.expected(red, blue, red_power, blue_power))
+        for team, sign in ((red, 1), (blue, -1)):
+            for l, name in enumerate(team):
+                self.overall[name] = self.overall.get(name, BASE_RATING) + sign * delta
+                self.roles[(name, l)] = self.roles.get((name, l), BASE_RATING) + sign * delta
+        self.games += 1
+
+    def replay(self, games):
+        # 전체 기록을 처음부터 다시 계산 (MatchLog.games / SqliteStore.games 형식)
+        self.clear()
+        for game in games:
+            red, blue = game_teams(game)
+            self.record(red, blue, game['winner'], game.get('red_power', 0), game.get('blue_power', 0))
+        return self.games
+
+    def rename(self, old_name, new_name):
+        # 메모리의 레이팅만 옮김, 기록 파일 쪽은 MatchLog.append_rename / SqliteStore.upsert_player
+        if old_name == new_name:
+            return
+        if old_name in self.overall:
+            self.overall[new_name] = self.overall.pop(old_name)
+        for l in range(len(ROLES_KEY)):
+            if (old_name, l) in self.roles:
+                self.roles[(new_name, l)] = self.roles.pop((old_name, l))
+
+    def rated_scores(self, player):
+        scores = {}
+        for l, role in enumerate(ROLES_KEY):
+            score = player.score(l) + self.adjustment(player.name, l)
+            scores[role] = min(MAX_SCORE, max(0, round(score)))
+        return scores
+
+    def rated_players(self, players, names):
+        # 밸런스 탐색용: names 선수의 점수를 레이팅으로 보정한 dict
+        return {name: RatedPlayer(players[name], self.rated_scores(players[name])) for name in names}
@@ -0,0 +1,84 @@
+from balancer import ROLES_KEY, MAX_SCORE
+from matchlog import game_teams
+from ratings import RatedPlayer
+
+# 경기 기록에서 모은 선수별 라인 전적 / 같은 라인 상대 전적
+PRIOR_GAMES = 6         # 경기 수가 적을 때 승률을 50% 쪽으로 당기는 가상 경기 수
+MAX_RATE_ADJUSTMENT = 2 # 라인 승률로 숙련도를 올리거나 내리는 최대 점수
+MATCHUP_LIMIT = 8       # History 창에 보여줄 상대 수
+
+class RoleStats:
+    def __init__(self):
+        self.roles = {}     # (이름, 라인 번호) -> [승, 패]
+        self.matchups = {}  # 이름 -> {(상대 이름, 라인 번호): [승, 패]}
+        self.games = 0
+
+    def clear(self):
+        self.roles.clear()
+        self.matchups.clear()
+        self.games = 0
+
+    def record(self, red, blue, winner):
+        # red/blue: ROLES_KEY 순서의 이름
+        red_won = 1 if winner == "RED" else 0
+        for l, (r_name, b_name) in enumerate(zip(red, blue)):
+            for name, opponent, won in ((r_name, b_name, red_won), (b_name, r_name, 1 - red_won)):
+                self.roles.setdefault((name, l), [0, 0])[1 - won] += 1
+                self.matchups.setdefault(name, {}).setdefault((opponent, l), [0, 0])[1 - won] += 1
+        self.games += 1
+
+    def replay(self, games):
+        # 전체 기록을 처음부터 다시 계산 (MatchLog.games / SqliteStore.games 형식)
+        self.clear()
+        for game in games:
+            red, blue = game_teams(game)
+            self.record(red, blue, game['winner'])
+        return self.games
+
+    def role_record(self, name, lane):
+        # (승, 패)
+        return tuple(self.roles.get((name, lane), (0, 0)))
+
+    def matchup(self, name, opponent, lane):
+        # name 이 lane 에서 opponent 를 상대로 한 (승, 패)
+        return tuple(self.matchups.get(name, {}).get((opponent, lane), (0, 0)))
+
+    def top_matchups(self, name, limit=MATCHUP_LIMIT):
+        # 많이 만난 순 [(상대, 라인 번호, 승, 패)]
+        found = [(opponent, l, w, lo) for (opponent, l), (w, lo) in self.matchups.get(name, {}).items()]
+        found.sort(key=lambda m: (-(m[2] + m[3]), m[0], m[1]))
+        return found[:limit]
+
+    def rename(self, old_name, new_name):
+        # 다시 불러올 때는 기록의 이름 바꾸기 줄(MatchLog.read)이 적용되므로 여기서는 메모리만
+        if old_name == new_name:
+            return
+        for l in range(len(ROLES_KEY)):
+            if (old_name, l) in self.roles:
+                self.roles[(new_name, l)] = self.roles.pop((old_name, l))
+        mine = self.matchups.pop(old_name, None)
+        if mine is None:
+            return
+        self.matchups[new_name] = mine
+        # 상대 쪽 기록의 키도 새 이름으로
+        for opponent, l in mine:
+            theirs = self.matchups.get(opponent, {})
+            if (old_name, l) in theirs:
+                theirs[(new_name, l)] = theirs.pop((old_name, l))
+
+    def adjustment(self, name, lane):
+        # 라인 승률(경기 수가 적으면 50% 쪽으로 보정)을 점수로, -MAX ~ +MAX
+        wins, losses = self.role_record(name, lane)
+        rate = (wins + PRIOR_GAMES / 2) / (wins + losses + PRIOR_GAMES)
+        return (rate - 0.5) * 2 * MAX_RATE_ADJUSTMENT
+
+    def weighted_scores(self, player):
+        scores = {}
+        for l, role in enumerate(ROLES_KEY):
+            score = player.score(l) + self.adjustment(player.name, l)
+            scores[role] = min(MAX_SCORE, max(0, round(score)))
+        return scores
+
+    def weighted_players(self, players, names):
+        # 밸런스 탐색용: names 선수의 점수를 라인 승률로 보정한 dict (레이팅 보정한 선수에도 사용 가능)
+        return {name: RatedPlayer(players[name], self.weighted_scores(players[name])) for name in names}
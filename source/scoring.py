@@ -0,0 +1,76 @@
+import itertools
+
+# 벤치마크 전용 (benchmark.py 에서만 import), GUI / 밸런스 탐색은 numpy 없이 동작
+import numpy as np
+
+from balancer import ROLES_KEY, WARN_DIFF, DANGER_DIFF, GAP_WEIGHT, SKILL_WEIGHT, MAX_SCORE, PENALTY, score_vectors
+
+PENALTY_TABLE = np.array(PENALTY, dtype=np.int64)
+
+class Roster:
+    # 참가자 점수를 (선수 수 x 라인 수) 정수 행렬로 묶어둔다
+    def __init__(self, players, names=None):
+        self.names = sorted(players) if names is None else list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.matrix = np.array(score_vectors(players, self.names),
+                               dtype=np.int16).reshape(len(self.names), len(ROLES_KEY))
+
+    def __len__(self):
+        return len(self.names)
+
+    def indices(self, names):
+        return np.array([self.index[name] for name in names], dtype=np.intp)
+
+def score_lineups(matrix, red, blue):
+    # red, blue: (N, 5) 배열, 라인 순서(ROLES_KEY)대로 선수 행 번호
+    red = np.asarray(red, dtype=np.intp)
+    blue = np.asarray(blue, dtype=np.intp)
+    count = len(red)
+
+    red_total = np.zeros(count, dtype=np.int64)
+    blue_total = np.zeros(count, dtype=np.int64)
+    warn = np.zeros(count, dtype=np.int64)
+    danger = np.zeros(count, dtype=np.int64)
+    diffs = np.empty((count, matrix.shape[1]), dtype=np.int16)
+
+    # 라인(열) 단위로 연속된 1차원 배열에서 꺼내는 편이 2차원 fancy indexing 보다 빠르다
+    for l, column in enumerate(np.ascontiguousarray(matrix.T)):
+        r_score = column.take(red[:, l])
+        b_score = column.take(blue[:, l])
+        red_total += r_score
+        blue_total += b_score
+        diff = np.abs(r_score - b_score)
+        diffs[:, l] = diff
+        danger += diff >= DANGER_DIFF
+        warn += diff >= WARN_DIFF
+    warn -= danger
+
+    cost = (PENALTY_TABLE.take(diffs).sum(axis=1) + GAP_WEIGHT * np.abs(red_total - blue_total)
+            + SKILL_WEIGHT * (2 * matrix.shape[1] * MAX_SCORE - red_total - blue_total))
+
+    return {
+        'red_total': red_total,
+        'blue_total': blue_total,
+        'diffs': diffs,
+        'warn': warn,
+        'danger': danger,
+        'cost': cost
+    }
+
+def enumerate_lineups(members):
+    # members 10명의 모든 팀 분배 x 라인 배치 (126 x 120 x 120)
+    # 레드/블루를 뒤집은 배치는 같으므로 members[0]은 항상 레드
+    members = list(members)
+    first, others = members[0], members[1:]
+    perms = np.array(list(itertools.permutations(range(5))), dtype=np.intp)
+
+    red_rows = []
+    blue_rows = []
+    for picked in itertools.combinations(others, 4):
+        red_team = np.array((first,) + picked, dtype=np.intp)
+        blue_team = np.array([m for m in others if m not in picked], dtype=np.intp)
+        red_perm = red_team[perms]
+        blue_perm = blue_team[perms]
+        red_rows.append(np.repeat(red_perm, len(perms), axis=0))
+        blue_rows.append(np.tile(blue_perm, (len(perms), 1)))
+    return np.concatenate(red_rows), np.concatenate(blue_rows)
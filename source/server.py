@@ -0,0 +1,255 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from balancer import ROLES_KEY, balance_top, lane_status
+from assignment import balance_by_roles_top
+from core import Player, load_roster, history_games
+from matchlog import journal_path
+from ratings import RatingBook
+
+# 디스코드 봇 / 신청 페이지에서 쓰는 로컬 HTTP 서비스 (GUI 없이 participants.json 을 읽음)
+#   python server.py [--file participants.json] [--port 8765] [--workers 2] [--timeout 5]
+#   GET  /players   선수 목록
+#   POST /balance   {"names": [10명], "top": 3, "roles": false, "ratings": false}
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 2
+REQUEST_TIMEOUT = 5.0   # 탐색 하나를 기다리는 최대 시간(초), 넘으면 504
+HEADER_TIMEOUT = 10.0   # 요청을 다 받을 때까지 기다리는 시간(초)
+QUEUE_PER_WORKER = 4    # 작업자 하나당 대기할 수 있는 탐색 수, 넘으면 503
+MAX_BODY = 64 * 1024
+MAX_TOP = 10
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def lineup_report(lineup, players):
+    # LaneRow 테두리와 같은 기준으로 라인별 점수차 표시
+    lanes = []
+    for l, (role, r_name, b_name) in enumerate(zip(ROLES_KEY, lineup.red, lineup.blue)):
+        r_score = players[r_name].score(l)
+        b_score = players[b_name].score(l)
+        diff = abs(r_score - b_score)
+        lanes.append({
+            'role': role,
+            'red': r_name,
+            'blue': b_name,
+            'red_score': r_score,
+            'blue_score': b_score,
+            'diff': diff,
+            'status': lane_status(diff)
+        })
+    return dict(lineup.to_dict(), gap=lineup.gap, warn=lineup.warn, danger=lineup.danger, lanes=lanes)
+
+def run_balance(roster, names, top, roles):
+    # 작업 프로세스에서 실행, roster: 10명의 Player.to_dict (레이팅 보정 점수 포함)
+    players = {name: Player.from_dict(data) for name, data in roster.items()}
+    search = balance_by_roles_top if roles else balance_top
+    return [lineup_report(lineup, players) for lineup in search(players, names, top)]
+
+def roster_stamp(path):
+    # GUI 가 저장하거나 경기를 기록하면 바뀌는 파일들의 수정 시각
+    stamp = []
+    for p in (path, journal_path(path), path + "-wal"):
+        try:
+            stamp.append(os.stat(p).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def read_roster(path):
+    # 반환값: (선수 dict, RatingBook, 건너뛴 항목)
+    errors = []
+    players, store, match_log = load_roster(path, errors)
+    try:
+        ratings = RatingBook()
+        ratings.replay(history_games(store, match_log))
+    finally:
+        if store:
+            store.close()
+    return players, ratings, errors
+
+class BalanceService:
+    def __init__(self, path, workers=DEFAULT_WORKERS, timeout=REQUEST_TIMEOUT):
+        self.path = path
+        self.timeout = timeout
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.max_pending = workers * QUEUE_PER_WORKER
+        self.pending = 0
+        self.players = {}
+        self.ratings = RatingBook()
+        self.stamp = None
+        self.reload_lock = asyncio.Lock()
+
+    async def roster(self):
+        # 파일이 바뀌었을 때만 다시 읽음 (읽기는 스레드에서, 이벤트 루프는 막지 않음)
+        async with self.reload_lock:
+            stamp = roster_stamp(self.path)
+            if stamp != self.stamp:
+                self.players, self.ratings, errors = await asyncio.get_running_loop().run_in_executor(
+                    None, read_roster, self.path)
+                self.stamp = stamp
+                for error in errors:
+                    print(f"Skipped {error}", file=sys.stderr)
+        return self.players, self.ratings
+
+    async def list_players(self):
+        players, ratings = await self.roster()
+        return {'players': [players[name].to_dict() for name in sorted(players)], 'games': ratings.games}
+
+    async def balance(self, request):
+        names = request.get('names')
+        top = request.get('top', 3)
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "'names' must be a list of player names")
+        if len(names) != 10 or len(set(names)) != 10:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Exactly 10 distinct players required.")
+        if type(top) is not int or not 1 <= top <= MAX_TOP:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"'top' must be between 1 and {MAX_TOP}")
+
+        players, ratings = await self.roster()
+        missing = [n for n in names if n not in players]
+        if missing:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown players: {', '.join(missing)}")
+        pool = ratings.rated_players(players, names) if request.get('ratings') else players
+        roster = {name: dict(players[name].to_dict(), scores=dict(pool[name].scores)) for name in names}
+
+        if self.pending >= self.max_pending:
+            raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many balance requests, try again later.")
+        self.pending += 1
+        try:
+            future = self.pool.submit(run_balance, roster, names, top, bool(request.get('roles')))
+            # 시간 초과 시 아직 시작 안 한 작업은 취소됨 (이미 도는 작업은 끝날 때까지 작업자 하나를 씀)
+            lineups = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise HttpError(HTTPStatus.GATEWAY_TIMEOUT, f"Balancing took longer than {self.timeout:g} s.") from None
+        finally:
+            self.pending -= 1
+        return {'names': names, 'lineups': lineups}
+
+    async def route(self, method, path, body):
+        path = path.split("?", 1)[0].rstrip("/")
+        if path == "/players":
+            if method != "GET":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET /players")
+            return await self.list_players()
+        if path == "/balance":
+            if method != "POST":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST /balance")
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError as e:
+                raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}") from None
+            if not isinstance(request, dict):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+            return await self.balance(request)
+        raise HttpError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path or '/'}")
+
+    async def handle(self, reader, writer):
+        # 요청 하나에 응답 하나 (Connection: close)
+        try:
+            try:
+                method, path, body = await asyncio.wait_for(read_request(reader), HEADER_TIMEOUT)
+                if method == "OPTIONS":
+                    status, result = HTTPStatus.NO_CONTENT, None
+                else:
+                    status, result = HTTPStatus.OK, await self.route(method, path, body)
+            except HttpError as e:
+                status, result = e.status, {'error': str(e)}
+            except asyncio.TimeoutError:
+                status, result = HTTPStatus.REQUEST_TIMEOUT, {'error': "Request not received in time."}
+            except Exception as e:
+                print(f"Request failed: {type(e).__name__}: {e}", file=sys.stderr)
+                status, result = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "Internal error."}
+            writer.write(http_response(status, result))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+async def read_request(reader):
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request.") from None
+    lines = head.decode("latin-1").split("\r\n")
+    parts = lines[0].split()
+    if len(parts) != 3:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+    method, path, _ = parts
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.") from None
+    if length < 0 or length > MAX_BODY:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Request body is limited to {MAX_BODY} bytes.")
+    try:
+        body = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Request body ended early.") from None
+    return method.upper(), path, body
+
+def http_response(status, result):
+    body = b"" if result is None else json.dumps(result, ensure_ascii=False).encode("utf-8")
+    head = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+        # 신청 페이지(브라우저)에서 바로 부를 수 있도록
+        "Access-Control-Allow-Origin: *",
+        "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+        "Access-Control-Allow-Headers: Content-Type",
+    ]
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+async def serve(path, host, port, workers, timeout):
+    service = BalanceService(path, workers, timeout)
+    try:
+        players, _ = await service.roster()
+        server = await asyncio.start_server(service.handle, host, port)
+        print(f"Serving {len(players)} players from {path} on http://{host}:{port} ({workers} workers)")
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="5v5 Balancer (HTTP service)")
+    parser.add_argument("--file", default="participants.json", help="participants.json or .db")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="balancing processes")
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT, help="seconds per balance request")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.file, args.host, args.port, max(1, args.workers), args.timeout))
+    except KeyboardInterrupt:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Failed to start: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import sqlite3
+from datetime import datetime
+
+from balancer import ROLES_KEY
+from matchlog import MatchLog
+
+SCORE_COLUMNS = [role.lower() for role in ROLES_KEY]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    main_role TEXT NOT NULL,
+    sub_role TEXT NOT NULL,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    {", ".join(f"{c} INTEGER NOT NULL" for c in SCORE_COLUMNS)}
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    time TEXT NOT NULL,
+    winner TEXT NOT NULL,
+    red_power INTEGER NOT NULL,
+    blue_power INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS match_players (
+    match_id INTEGER NOT NULL REFERENCES matches(id),
+    side TEXT NOT NULL,
+    lane TEXT NOT NULL,
+    player TEXT NOT NULL,
+    PRIMARY KEY (match_id, side, lane)
+);
+CREATE INDEX IF NOT EXISTS match_players_player ON match_players(player);
+"""
+
+PLAYER_COLUMNS = ["name", "main_role", "sub_role", "wins", "losses"] + SCORE_COLUMNS
+UPSERT_PLAYER = (f"INSERT INTO players ({', '.join(PLAYER_COLUMNS)}) VALUES ({', '.join('?' * len(PLAYER_COLUMNS))}) "
+                 f"ON CONFLICT(name) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in PLAYER_COLUMNS[1:])}")
+
+def is_sqlite_path(path):
+    return path.lower().endswith((".db", ".sqlite", ".sqlite3"))
+
+class SqliteStore:
+    # participants.json 대신 쓰는 SQLite 저장소 (선수 목록 + 경기 기록)
+    def __init__(self, path):
+        self.path = path
+        # 시작 시 불러오기 스레드에서도 읽으므로 (동시에 쓰지는 않음) 스레드 검사 해제
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def player_row(self, player):
+        return [player.name, player.main_role, player.sub_role, player.wins, player.losses] + \
+               list(player.vector())
+
+    def player_dict(self, row):
+        data = dict(zip(PLAYER_COLUMNS, row))
+        data['scores'] = {role: data.pop(c) for role, c in zip(ROLES_KEY, SCORE_COLUMNS)}
+        return data
+
+    def load_players(self, factory):
+        # factory: Player.from_dict
+        rows = self.conn.execute(f"SELECT {', '.join(PLAYER_COLUMNS)} FROM players ORDER BY name")
+        players = {}
+        for row in rows:
+            player = factory(self.player_dict(row))
+            players[player.name] = player
+        return players
+
+    def upsert_player(self, player, original_name=None):
+        row = self.player_row(player)
+        with self.conn:
+            if original_name and original_name != player.name:
+                self.conn.execute("DELETE FROM players WHERE name = ?", (original_name,))
+                self.conn.execute("UPDATE match_players SET player = ? WHERE player = ?", (player.name, original_name))
+            self.conn.execute(UPSERT_PLAYER, row)
+
+    def delete_player(self, name):
+        with self.conn:
+            self.conn.execute("DELETE FROM players WHERE name = ?", (name,))
+
+    def save_players(self, players):
+        # 전체 목록을 한 트랜잭션으로 맞춤 (가져오기 등 대량 작업용)
+        with self.conn:
+            self.conn.executemany(UPSERT_PLAYER, [self.player_row(p) for p in players])
+
+    def record_game(self, red, blue, winner, red_power, blue_power, time=None):
+        # 경기 한 판: 경기 기록 + 10명 배치 + 승/패 갱신을 한 트랜잭션으로
+        winners, losers = (red, blue) if winner == "RED" else (blue, red)
+        with self.conn:
+            self.insert_game(red, blue, winner, red_power, blue_power, time)
+            self.conn.executemany("UPDATE players SET wins = wins + 1 WHERE name = ?", [(n,) for n in winners])
+            self.conn.executemany("UPDATE players SET losses = losses + 1 WHERE name = ?", [(n,) for n in losers])
+
+    def insert_game(self, red, blue, winner, red_power, blue_power, time=None):
+        time = time or datetime.now().isoformat(timespec="seconds")
+        cur = self.conn.execute("INSERT INTO matches (time, winner, red_power, blue_power) VALUES (?, ?, ?, ?)",
+                                (time, winner, red_power, blue_power))
+        match_id = cur.lastrowid
+        rows = [(match_id, "RED", lane, name) for lane, name in zip(ROLES_KEY, red)]
+        rows += [(match_id, "BLUE", lane, name) for lane, name in zip(ROLES_KEY, blue)]
+        self.conn.executemany("INSERT INTO match_players (match_id, side, lane, player) VALUES (?, ?, ?, ?)", rows)
+
+    def games(self):
+        # matchlog.MatchLog.games() 와 같은 형식
+        lanes = {lane: i for i, lane in enumerate(ROLES_KEY)}
+        games = {}
+        for match_id, time, winner, red_power, blue_power in self.conn.execute(
+                "SELECT id, time, winner, red_power, blue_power FROM matches ORDER BY id"):
+            games[match_id] = {
+                'type': "game",
+                'time': time,
+                'lanes': ROLES_KEY,
+                'red': [None] * len(ROLES_KEY),
+                'blue': [None] * len(ROLES_KEY),
+                'winner': winner,
+                'red_power': red_power,
+                'blue_power': blue_power
+            }
+        for match_id, side, lane, player in self.conn.execute("SELECT match_id, side, lane, player FROM match_players"):
+            games[match_id][side.lower()][lanes[lane]] = player
+        return list(games.values())
+
+    def import_json(self, json_path, errors=None):
+        # 기존 participants.json 과 경기 기록(.matches.jsonl)을 그대로 옮김
+        # 불러오기와 같은 검사(core.read_players), 잘못된 항목은 errors 에 남기고 건너뜀 (errors 가 없으면 ValueError)
+        from core import read_players
+        players = read_players(json_path, errors)
+
+        # 스냅샷 이후 기록만 있고 아직 반영 안 된 경기는 승/패에 더해서 가져옴
+        match_log = MatchLog(json_path)
+        match_log.replay(players)
+
+        with self.conn:
+            self.conn.executemany(UPSERT_PLAYER, [self.player_row(p) for p in players.values()])
+            for game in match_log.games():
+                self.insert_game(game['red'], game['blue'], game['winner'],
+                                 game['red_power'], game['blue_power'], game['time'])
+        return len(players)
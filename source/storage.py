@@ -0,0 +1,83 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+# 연속된 저장 요청을 한 번의 쓰기로 모으는 대기 시간(초)
+SAVE_DELAY = 0.3
+
+def atomic_write_json(path, data, before_replace=None):
+    # 같은 폴더의 임시 파일에 다 쓴 뒤 이름을 바꿔서, 도중에 꺼져도 기존 파일이 남도록 함
+    # before_replace(임시 파일 경로): 이름을 바꾸기 직전에 호출 (같이 남겨야 하는 정보를 먼저 기록)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        if before_replace:
+            before_replace(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class BackgroundWriter:
+    # 저장 요청을 파일별로 마지막 것만 남겨 백그라운드 스레드에서 기록 (UI 스레드는 디스크를 기다리지 않음)
+    def __init__(self, delay=SAVE_DELAY):
+        self.delay = delay
+        self.jobs = {}      # path -> (data, on_saved, before_replace)
+        self.busy = False
+        self.closed = False
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="roster-writer", daemon=True)
+        self.thread.start()
+
+    def request(self, path, data, on_saved=None, before_replace=None):
+        with self.cond:
+            self.jobs[path] = (data, on_saved, before_replace)
+            self.cond.notify_all()
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.jobs and not self.closed:
+                    self.cond.wait()
+                if not self.jobs:
+                    return
+            if not self.closed:
+                time.sleep(self.delay)
+
+            with self.cond:
+                jobs, self.jobs = self.jobs, {}
+                self.busy = True
+            for path, (data, on_saved, before_replace) in jobs.items():
+                try:
+                    atomic_write_json(path, data, before_replace)
+                    if on_saved:
+                        on_saved()
+                except Exception as e:
+                    print(f"Save failed: {e}")
+            with self.cond:
+                self.busy = False
+                self.cond.notify_all()
+
+    def flush(self, timeout=None):
+        # 대기 중인 저장이 모두 끝날 때까지 기다림
+        with self.cond:
+            self.cond.notify_all()
+            return self.cond.wait_for(lambda: not self.jobs and not self.busy, timeout)
+
+    def close(self, timeout=None):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self.thread.join(timeout)
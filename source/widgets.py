@@ -0,0 +1,215 @@
+import queue
+import threading
+import time
+
+import customtkinter as ctk
+
+# 112.py 와 windows.py 가 같이 쓰는 색상/로케일/목록 위젯, 백그라운드 작업
+
+COLORS = {
+    "bg_main": "#36393F",       
+    "bg_sec": "#2F3136",        
+    "card": "#202225",          
+    "accent": "#5865F2",        
+    "danger": "#ED4245",        
+    "success": "#57F287",      
+    "edit": "#FAA61A",          
+    "text_main": "#FFFFFF",     
+    "text_dim": "#B9BBBE",      
+    "border_warn": "#FAA61A"    
+}
+
+# 로케일 데이터
+LOCALE = {
+    "KR": {
+        "roles": ["탑", "정글", "미드", "원딜", "서폿"],
+        "role_opts": ["선택 안함", "탑", "정글", "미드", "원딜", "서폿"]
+    },
+    "EN": {
+        "roles": ["TOP", "JUNGLE", "MID", "ADC", "SUPPORT"],
+        "role_opts": ["None", "TOP", "JUNGLE", "MID", "ADC", "SUPPORT"]
+    }
+}
+
+def lineup_border_color(lineup):
+    if lineup.danger:
+        return COLORS["danger"]
+    if lineup.warn:
+        return COLORS["border_warn"]
+    return COLORS["bg_sec"]
+
+class VirtualList(ctk.CTkFrame):
+    # 보이는 줄 만큼만 행 위젯을 만들고 스크롤 시 행 내용만 바꿔 끼움
+    # 하위 클래스: row_count(), make_row(), bind_row(row, index)
+    ROW_HEIGHT = 36
+
+    def __init__(self, parent):
+        super().__init__(parent, fg_color="transparent")
+        self.top = 0        # 맨 위에 보이는 줄 번호
+        self.rows = []
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # 창 단위로 바인딩 (창이 닫히면 같이 사라짐)
+        self.viewport.bind("<Configure>", lambda e: self.render())
+        window = self.winfo_toplevel()
+        window.bind("<MouseWheel>", self.on_wheel, add="+")
+        window.bind("<Button-4>", self.on_wheel, add="+")
+        window.bind("<Button-5>", self.on_wheel, add="+")
+
+    def row_count(self):
+        raise NotImplementedError
+
+    def make_row(self):
+        raise NotImplementedError
+
+    def bind_row(self, row, index):
+        raise NotImplementedError
+
+    def visible_rows(self):
+        return max(1, self.viewport.winfo_height() // self.ROW_HEIGHT + 1)
+
+    def scroll_to(self, top):
+        max_top = max(0, self.row_count() - self.visible_rows() + 1)
+        top = min(max(0, int(top)), max_top)
+        if top != self.top:
+            self.top = top
+            self.render()
+
+    def on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.row_count())
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.visible_rows() - 1 if args[2] == "pages" else 1)
+            self.scroll_to(self.top + step)
+
+    def on_wheel(self, event):
+        # 포인터가 이 목록 위에 있을 때만 스크롤
+        try:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # 콤보박스 드롭다운 등 Tk 내부 위젯 위에서는 경로를 찾지 못함
+            return
+        if widget is None or not str(widget).startswith(str(self)):
+            return
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.top - 3)
+        else:
+            self.scroll_to(self.top + 3)
+
+    def render(self):
+        count = self.row_count()
+        visible = self.visible_rows()
+        self.top = min(self.top, max(0, count - visible + 1))
+        while len(self.rows) < visible:
+            self.rows.append(self.make_row())
+
+        for i, row in enumerate(self.rows):
+            idx = self.top + i
+            if i < visible and idx < count:
+                self.bind_row(row, idx)
+                row.place(x=0, y=i * self.ROW_HEIGHT, relwidth=1, height=self.ROW_HEIGHT - 2)
+            else:
+                row.place_forget()
+
+        if count:
+            self.scrollbar.set(self.top / count, min(1.0, (self.top + visible - 1) / count))
+        else:
+            self.scrollbar.set(0, 1)
+
+class ProfileOverlay(ctk.CTkLabel):
+    # BALANCER_PROFILE 사용 시 창 오른쪽 아래에 처리 시간 통계 표시 (Ctrl+Shift+P)
+    REFRESH_MS = 1000
+
+    def __init__(self, parent, profiler):
+        super().__init__(parent, text="", font=("Consolas", 11), justify="left", anchor="w",
+                         fg_color=COLORS["card"], text_color=COLORS["text_dim"], corner_radius=6)
+        self.profiler = profiler
+        self.job = None
+
+    def toggle(self):
+        if self.job:
+            self.after_cancel(self.job)
+            self.job = None
+            self.place_forget()
+        else:
+            self.place(relx=1.0, rely=1.0, x=-10, y=-10, anchor="se")
+            self.lift()
+            self.refresh()
+
+    def refresh(self):
+        text = self.profiler.format_report()
+        if self.profiler.capture:
+            text += "\n[cProfile armed: next action]"
+        if self.cget("text") != text:
+            self.configure(text=text)
+        self.job = self.after(self.REFRESH_MS, self.refresh)
+
+class BackgroundJob:
+    # work(report, cancel) 를 스레드에서 실행하고 중간 결과/완료는 after() 로 UI 스레드에서 받음
+    #   report(값): 중간 결과 전달 (poll 사이에 여러 번 오면 마지막 것만 on_progress 로)
+    #   cancel: threading.Event, work 가 확인해서 일찍 끝내도록
+    #   on_done(결과 또는 예외, 작업에 걸린 시간), on_tick(지난 시간): 끝나기 전 poll 마다
+    POLL_MS = 50
+
+    def __init__(self, widget, work, on_progress=None, on_done=None, on_tick=None, poll_ms=POLL_MS, name="background-job"):
+        self.widget = widget
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_tick = on_tick
+        self.poll_ms = poll_ms
+        self.queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.start = time.perf_counter()
+        self.job = None
+        threading.Thread(target=self.run, args=(work,), name=name, daemon=True).start()
+        self.job = widget.after(poll_ms, self.poll)
+
+    @property
+    def running(self):
+        return self.job is not None
+
+    def run(self, work):
+        try:
+            result = work(lambda value: self.queue.put(('progress', value)), self.cancel_event)
+        except Exception as e:
+            result = e
+        self.queue.put(('done', (result, time.perf_counter() - self.start)))
+
+    def poll(self):
+        self.job = None
+        progress = done = None
+        has_progress = has_done = False
+        while not has_done:
+            try:
+                kind, value = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'done':
+                has_done, done = True, value
+            else:
+                has_progress, progress = True, value
+
+        if has_progress and self.on_progress:
+            self.on_progress(progress)
+        if has_done:
+            if self.on_done:
+                self.on_done(*done)
+            return
+        if self.on_tick:
+            self.on_tick(time.perf_counter() - self.start)
+        self.job = self.widget.after(self.poll_ms, self.poll)
+
+    def cancel(self):
+        # 작업에 그만하라고 알림 (on_done 은 작업이 끝나면 그대로 불림)
+        self.cancel_event.set()
+
+    def stop(self):
+        # 창을 닫을 때: 취소하고 결과도 받지 않음
+        self.cancel_event.set()
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
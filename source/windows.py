@@ -0,0 +1,421 @@
+import customtkinter as ctk
+from tkinter import messagebox
+
+from balancer import ROLES_KEY
+from core import Player
+from leaderboard import COLUMNS, DEFAULT_COLUMN
+from widgets import COLORS, LOCALE, VirtualList, BackgroundJob, lineup_border_color
+from profiling import profiler, profiled
+
+# 버튼을 눌렀을 때 처음 import 되는 창들 (시작 시간에 포함되지 않음)
+LOBBY_TIME_BUDGET = 3.0     # Lobby 밸런스 탐색 시간(초)
+
+class SuggestionWindow(ctk.CTkToplevel):
+    def __init__(self, parent, lineups, apply_callback):
+        super().__init__(parent)
+        self.title("Balanced Lineups")
+        self.geometry("640x600")
+        self.configure(fg_color=COLORS["bg_main"])
+        self.transient(parent)
+
+        ctk.CTkLabel(self, text="TOP LINEUPS", font=("Roboto Medium", 20), text_color=COLORS["text_main"]).pack(pady=20)
+
+        scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        scroll.pack(fill="both", expand=True, padx=10, pady=5)
+
+        for rank, lineup in enumerate(lineups, 1):
+            row = ctk.CTkFrame(scroll, fg_color=COLORS["card"], corner_radius=8,
+                               border_width=2, border_color=lineup_border_color(lineup))
+            row.pack(fill="x", pady=3)
+
+            summary = f"#{rank}   Power {lineup.red_total} : {lineup.blue_total}   (warn {lineup.warn}, danger {lineup.danger})"
+            ctk.CTkLabel(row, text=summary, font=("Roboto", 13, "bold"), text_color=COLORS["text_main"], anchor="w").pack(fill="x", padx=10, pady=(6, 0))
+            ctk.CTkLabel(row, text=" / ".join(lineup.red), font=("Roboto", 12), text_color=COLORS["danger"], anchor="w").pack(fill="x", padx=10)
+            ctk.CTkLabel(row, text=" / ".join(lineup.blue), font=("Roboto", 12), text_color=COLORS["accent"], anchor="w").pack(fill="x", padx=10, pady=(0, 6))
+
+            ctk.CTkButton(row, text="Apply", width=70, height=28, fg_color=COLORS["success"],
+                          command=lambda l=lineup: apply_callback(l)).place(relx=1.0, rely=0.5, x=-10, anchor="e")
+
+class LobbyWindow(ctk.CTkToplevel):
+    def __init__(self, parent, participants, apply_callback):
+        super().__init__(parent)
+        self.participants = participants
+        self.apply_callback = apply_callback
+        self.title("Lobby")
+        self.geometry("900x600")
+        self.configure(fg_color=COLORS["bg_main"])
+        self.transient(parent)
+
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        # 체크인 목록
+        left = ctk.CTkFrame(self, fg_color=COLORS["bg_sec"], width=240)
+        left.grid(row=0, column=0, sticky="nsew", padx=(10, 5), pady=10)
+
+        self.count_lbl = ctk.CTkLabel(left, text="", font=("Roboto", 14, "bold"), text_color=COLORS["text_dim"])
+        self.count_lbl.pack(pady=(10, 5))
+
+        check_list = ctk.CTkScrollableFrame(left, fg_color="transparent")
+        check_list.pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.check_vars = {}
+        for name in sorted(participants.keys()):
+            var = ctk.BooleanVar(value=True)
+            self.check_vars[name] = var
+            ctk.CTkCheckBox(check_list, text=name, variable=var, command=self.update_count,
+                            fg_color=COLORS["accent"], text_color=COLORS["text_main"]).pack(anchor="w", pady=2)
+
+        # 탐색 중: 진행 막대 + 지금까지의 최선을 그대로 쓰기(Stop) / 버리기(Cancel)
+        self.progress_bar = ctk.CTkProgressBar(left, progress_color=COLORS["accent"])
+        self.progress_bar.set(0)
+        self.status_lbl = ctk.CTkLabel(left, text="", font=("Roboto", 12), text_color=COLORS["text_dim"])
+        self.status_lbl.pack(fill="x", padx=10)
+
+        self.btn_run = ctk.CTkButton(left, text="Balance Lobby", command=self.run_balance, height=40,
+                                     fg_color=COLORS["accent"], font=("Roboto", 13, "bold"))
+        self.btn_run.pack(fill="x", padx=10, pady=10)
+        self.run_btns = ctk.CTkFrame(left, fg_color="transparent")
+        ctk.CTkButton(self.run_btns, text="Stop (Keep Best)", command=self.accept_best, height=32,
+                      fg_color=COLORS["success"], text_color=COLORS["card"]).pack(side="left", fill="x", expand=True, padx=(0, 3))
+        ctk.CTkButton(self.run_btns, text="Cancel", command=self.cancel_balance, height=32, width=70,
+                      fg_color=COLORS["danger"]).pack(side="left", padx=(3, 0))
+
+        # 결과
+        self.result_list = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        self.result_list.grid(row=0, column=1, sticky="nsew", padx=(5, 10), pady=10)
+
+        self.job = None
+        self.best = None
+        self.accepted = None    # 마지막으로 끝까지 받은 결과 (Cancel 하면 이걸로 되돌림)
+        self.update_count()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def checked_names(self):
+        return [name for name, var in self.check_vars.items() if var.get()]
+
+    def update_count(self):
+        count = len(self.checked_names())
+        self.count_lbl.configure(text=f"Checked in: {count}  ({count // 10} matches)")
+
+    @profiled("lobby")
+    def run_balance(self):
+        names = self.checked_names()
+        if len(names) < 10:
+            messagebox.showwarning("Lobby", "Check in at least 10 players.", parent=self)
+            return
+
+        from lobby import balance_lobby
+        # 스레드에서 탐색하고, 더 좋은 결과가 나올 때마다 바로 보여줌 (창은 계속 반응)
+        players = {name: self.participants[name] for name in names}
+        self.best = None
+        self.job = BackgroundJob(
+            self,
+            lambda report, cancel: balance_lobby(players, names, time_budget=LOBBY_TIME_BUDGET,
+                                                 progress=report, cancel=cancel),
+            on_progress=self.on_progress, on_done=self.on_done, on_tick=self.on_tick, name="lobby-balancer")
+        self.set_running(True)
+
+    def set_running(self, running):
+        if running:
+            self.progress_bar.set(0)
+            self.status_lbl.configure(text="Searching...")
+            self.progress_bar.pack(fill="x", padx=10, pady=(10, 0), before=self.status_lbl)
+            self.btn_run.pack_forget()
+            self.run_btns.pack(fill="x", padx=10, pady=10)
+        else:
+            self.progress_bar.pack_forget()
+            self.run_btns.pack_forget()
+            self.btn_run.pack(fill="x", padx=10, pady=10)
+
+    def on_tick(self, elapsed):
+        self.progress_bar.set(min(1.0, elapsed / LOBBY_TIME_BUDGET))
+
+    def on_progress(self, result):
+        self.best = result
+        self.status_lbl.configure(text=f"Best so far: {len(result.matches)} matches, "
+                                       f"warn {sum(m.warn for m in result.matches)}, "
+                                       f"danger {sum(m.danger for m in result.matches)}")
+        self.show_result(result)
+
+    def on_done(self, result, elapsed):
+        self.job = None
+        self.set_running(False)
+        profiler.record("lobby thread", elapsed)
+        if isinstance(result, Exception):
+            self.status_lbl.configure(text="")
+            messagebox.showerror("Lobby", f"Balancing failed: {result}", parent=self)
+            return
+        if result is None:
+            self.status_lbl.configure(text="Stopped before any result.")
+            return
+        self.status_lbl.configure(text=f"Done in {elapsed:.1f} s")
+        self.accepted = result
+        if result is not self.best:
+            self.best = result
+            self.show_result(result)
+
+    def accept_best(self):
+        # 남은 시간을 기다리지 않고 지금까지의 최선으로 끝냄 (on_done 이 그대로 불림)
+        if self.job:
+            self.job.cancel()
+            self.status_lbl.configure(text="Stopping...")
+
+    def cancel_balance(self):
+        # 탐색 결과를 버리고 이전 결과로 되돌림
+        if not self.job:
+            return
+        self.job.stop()
+        self.job = None
+        self.set_running(False)
+        self.status_lbl.configure(text="Cancelled.")
+        self.best = None
+        self.show_result(self.accepted)
+
+    def on_close(self):
+        if self.job:
+            self.job.stop()
+        self.destroy()
+
+    def show_result(self, result):
+        for widget in self.result_list.winfo_children():
+            widget.destroy()
+        if result is None:
+            return
+
+        for i, lineup in enumerate(result.matches, 1):
+            card = ctk.CTkFrame(self.result_list, fg_color=COLORS["card"], corner_radius=8,
+                                border_width=2, border_color=lineup_border_color(lineup))
+            card.pack(fill="x", pady=4)
+
+            ctk.CTkLabel(card, text=f"MATCH {i}   Power {lineup.red_total} : {lineup.blue_total}",
+                         font=("Roboto", 13, "bold"), text_color=COLORS["text_main"], anchor="w").pack(fill="x", padx=10, pady=(6, 0))
+            ctk.CTkLabel(card, text=" / ".join(lineup.red), font=("Roboto", 12), text_color=COLORS["danger"], anchor="w").pack(fill="x", padx=10)
+            ctk.CTkLabel(card, text=" / ".join(lineup.blue), font=("Roboto", 12), text_color=COLORS["accent"], anchor="w").pack(fill="x", padx=10, pady=(0, 6))
+            ctk.CTkButton(card, text="Load", width=70, height=28, fg_color=COLORS["success"],
+                          command=lambda l=lineup: self.apply_callback(l)).place(relx=1.0, rely=0.5, x=-10, anchor="e")
+
+        if result.bench:
+            ctk.CTkLabel(self.result_list, text="Bench: " + ", ".join(result.bench), font=("Roboto", 12),
+                         text_color=COLORS["text_dim"], anchor="w", wraplength=560, justify="left").pack(fill="x", pady=8)
+
+class PlayerDialog(ctk.CTkToplevel):
+    def __init__(self, parent, callback, current_lang="KR", player_to_edit=None, original_name=None):
+        super().__init__(parent)
+        self.callback = callback
+        self.current_lang = current_lang
+        self.player_to_edit = player_to_edit
+        self.original_name = original_name
+
+        self.role_names = LOCALE[self.current_lang]["roles"]
+        self.role_opts = LOCALE[self.current_lang]["role_opts"]
+
+        title_text = "Edit Player" if player_to_edit else "Add Player"
+        btn_text = "Save" if player_to_edit else "Register"
+        
+        self.title(title_text)
+        self.geometry("400x550")
+        self.configure(fg_color=COLORS["bg_main"])
+        self.resizable(False, False)
+        self.transient(parent)
+        self.grab_set()
+
+        ctk.CTkLabel(self, text=title_text, font=("Roboto Medium", 20), text_color=COLORS["text_main"]).pack(pady=(20, 10))
+
+        self.name_entry = ctk.CTkEntry(self, placeholder_text="Name", width=300, height=40, fg_color=COLORS["card"])
+        self.name_entry.pack(pady=10)
+        
+        if player_to_edit:
+            self.name_entry.insert(0, player_to_edit.name)
+
+        # 역할 선택
+        role_frame = ctk.CTkFrame(self, fg_color="transparent")
+        role_frame.pack(pady=5, padx=50, fill="x")
+
+        ctk.CTkLabel(role_frame, text="Main Role", font=("Roboto", 12), text_color=COLORS["text_dim"]).grid(row=0, column=0, padx=5, sticky="w")
+        self.main_role_combo = ctk.CTkComboBox(role_frame, values=self.role_opts, width=140, state="readonly")
+        self.main_role_combo.grid(row=1, column=0, padx=5, pady=(0, 10))
+        
+        ctk.CTkLabel(role_frame, text="Sub Role", font=("Roboto", 12), text_color=COLORS["text_dim"]).grid(row=0, column=1, padx=5, sticky="w")
+        self.sub_role_combo = ctk.CTkComboBox(role_frame, values=self.role_opts, width=140, state="readonly")
+        self.sub_role_combo.grid(row=1, column=1, padx=5, pady=(0, 10))
+
+        if player_to_edit:
+            # 라인은 정수 코드로 저장되므로 현재 언어의 이름으로 표시 (role_opts[0] 은 선택 안함)
+            m_role = self.role_opts[player_to_edit.main_code]
+            s_role = self.role_opts[player_to_edit.sub_code]
+            self.main_role_combo.set(m_role)
+            self.sub_role_combo.set(s_role)
+        else:
+            self.main_role_combo.set(self.role_opts[0])
+            self.sub_role_combo.set(self.role_opts[0])
+
+        # 점수 슬라이더
+        score_container = ctk.CTkFrame(self, fg_color="transparent")
+        score_container.pack(pady=10, padx=20, fill="x")
+
+        self.score_vars = {}
+        self.score_labels = {}
+
+        for i, role_key in enumerate(ROLES_KEY):
+            row = ctk.CTkFrame(score_container, fg_color=COLORS["bg_sec"], corner_radius=8)
+            row.pack(fill="x", pady=5, ipady=5)
+
+            lbl = ctk.CTkLabel(row, text=self.role_names[i], width=60, font=("Roboto", 12, "bold"), text_color=COLORS["text_dim"])
+            lbl.pack(side="left", padx=10)
+
+            initial_val = 5
+            if player_to_edit:
+                initial_val = player_to_edit.scores.get(role_key, 5)
+
+            val_lbl = ctk.CTkLabel(row, text=str(initial_val), width=30, font=("Roboto", 14, "bold"), text_color=COLORS["accent"])
+            val_lbl.pack(side="right", padx=10)
+            self.score_labels[role_key] = val_lbl
+
+            var = ctk.IntVar(value=initial_val)
+            self.score_vars[role_key] = var
+            
+            slider = ctk.CTkSlider(row, from_=0, to=10, number_of_steps=10, variable=var,
+                                   command=lambda v, r=role_key: self.update_label(r, v),
+                                   progress_color=COLORS["accent"], button_color="white", button_hover_color=COLORS["accent"])
+            slider.pack(side="right", fill="x", expand=True, padx=10)
+
+        ctk.CTkButton(self, text=btn_text, command=self.save_player, width=300, height=45, fg_color=COLORS["success"], font=("Roboto", 14, "bold")).pack(pady=20, side="bottom")
+
+    def update_label(self, role, value):
+        self.score_labels[role].configure(text=str(int(value)))
+
+    def save_player(self):
+        name = self.name_entry.get().strip()
+        if not name:
+            messagebox.showwarning("Error", "Name required.")
+            return
+
+        scores = {role: self.score_vars[role].get() for role in ROLES_KEY}
+        
+        # 기존 승/패 정보 유지
+        wins = 0
+        losses = 0
+        if self.player_to_edit:
+            wins = self.player_to_edit.wins
+            losses = self.player_to_edit.losses
+
+        new_player = Player(name, scores, self.main_role_combo.get(), self.sub_role_combo.get(), wins, losses)
+        
+        if self.original_name:
+            self.callback(new_player, self.original_name)
+        else:
+            self.callback(new_player)
+        self.destroy()
+
+HISTORY_WIDTHS = [140, 70, 70, 70, 90]
+
+class HistoryRow(ctk.CTkFrame):
+    # HistoryTable 이 재사용하는 한 줄, 바뀐 칸만 다시 그림 (누르면 그 선수의 라인 전적 표시)
+    def __init__(self, parent, select_command):
+        super().__init__(parent, fg_color=COLORS["card"])
+        self.name = None
+        self.bind("<Button-1>", lambda e: select_command(self.name))
+        colors = [COLORS["text_main"], COLORS["text_main"], COLORS["success"], COLORS["danger"], COLORS["accent"]]
+        self.labels = []
+        for i, (width, color) in enumerate(zip(HISTORY_WIDTHS, colors)):
+            lbl = ctk.CTkLabel(self, text="", width=width, anchor="w" if i == 0 else "center", text_color=color)
+            lbl.pack(side="left", padx=5)
+            lbl.bind("<Button-1>", lambda e: select_command(self.name))
+            self.labels.append(lbl)
+        self.texts = [None] * len(self.labels)
+
+    def set_player(self, p):
+        self.name = p.name
+        total = p.wins + p.losses
+        rate = f"{(p.wins/total)*100:.1f}%" if total > 0 else "-"
+        for i, text in enumerate([p.name, str(total), str(p.wins), str(p.losses), rate]):
+            if text != self.texts[i]:
+                self.texts[i] = text
+                self.labels[i].configure(text=text)
+
+class HistoryTable(VirtualList):
+    ROW_HEIGHT = 34
+
+    def __init__(self, parent, leaderboard, select_command):
+        super().__init__(parent)
+        self.leaderboard = leaderboard
+        self.select_command = select_command
+        self.column = DEFAULT_COLUMN
+        self.descending = True
+
+    def row_count(self):
+        return len(self.leaderboard)
+
+    def make_row(self):
+        return HistoryRow(self.viewport, self.select_command)
+
+    def bind_row(self, row, index):
+        row.set_player(self.leaderboard.row(self.column, self.descending, index))
+
+    def sort_by(self, column, descending):
+        self.column = column
+        self.descending = descending
+        self.top = 0
+        self.render()
+
+def lane_record_text(wins, losses):
+    total = wins + losses
+    return f"{wins}-{losses} ({wins / total * 100:.0f}%)" if total else "-"
+
+class HistoryWindow(ctk.CTkToplevel):
+    def __init__(self, parent, leaderboard, role_stats):
+        super().__init__(parent)
+        self.title("Match History")
+        self.geometry("600x680")
+        self.configure(fg_color=COLORS["bg_main"])
+        self.transient(parent)
+        self.grab_set()
+
+        ctk.CTkLabel(self, text="HALL OF FAME", font=("Roboto Medium", 20), text_color=COLORS["text_main"]).pack(pady=20)
+
+        # 헤더 (누르면 그 컬럼으로 정렬, 다시 누르면 순서 반전)
+        header_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_sec"], height=40)
+        header_frame.pack(fill="x", padx=10, pady=5)
+
+        self.header_btns = {}
+        for column, width in zip(COLUMNS, HISTORY_WIDTHS):
+            btn = ctk.CTkButton(header_frame, text=column, width=width, font=("Roboto", 12, "bold"),
+                                fg_color="transparent", hover_color=COLORS["card"], text_color=COLORS["text_dim"],
+                                command=lambda c=column: self.on_header(c))
+            btn.pack(side="left", padx=5)
+            self.header_btns[column] = btn
+
+        # 리스트 (기본: 총 경기 수 순, 보이는 줄만 그림)
+        self.table = HistoryTable(self, leaderboard, self.show_lanes)
+        self.table.pack(fill="both", expand=True, padx=10, pady=5)
+        self.update_headers()
+
+        # 선택한 선수의 라인별 전적 + 같은 라인에서 자주 만난 상대
+        self.role_stats = role_stats
+        self.lane_lbl = ctk.CTkLabel(self, text="Click a player to see lane records.", font=("Roboto", 12),
+                                     fg_color=COLORS["bg_sec"], text_color=COLORS["text_dim"], corner_radius=8,
+                                     anchor="w", justify="left", wraplength=560)
+        self.lane_lbl.pack(fill="x", padx=10, pady=(5, 10), ipadx=10, ipady=8)
+
+    def show_lanes(self, name):
+        if name is None:
+            return
+        lanes = "   ".join(f"{role} {lane_record_text(*self.role_stats.role_record(name, l))}"
+                           for l, role in enumerate(ROLES_KEY))
+        matchups = ", ".join(f"{opponent} ({ROLES_KEY[l]}) {w}-{lo}"
+                             for opponent, l, w, lo in self.role_stats.top_matchups(name))
+        self.lane_lbl.configure(text=f"{name}\n{lanes}\nvs  {matchups or '-'}", text_color=COLORS["text_main"])
+
+    def on_header(self, column):
+        if column == self.table.column:
+            descending = not self.table.descending
+        else:
+            descending = column != "Name"
+        self.table.sort_by(column, descending)
+        self.update_headers()
+
+    def update_headers(self):
+        for column, btn in self.header_btns.items():
+            arrow = (" ▼" if self.table.descending else " ▲") if column == self.table.column else ""
+            btn.configure(text=column + arrow)